@@ -4,21 +4,47 @@ Agent Service for handling conversation and message operations
 
 import json
 import logging
-from typing import Dict, Any, Optional, Generator
+from functools import cache
+from typing import TYPE_CHECKING, Dict, Any, Optional, AsyncGenerator, Iterator
+from asgiref.sync import sync_to_async
 from django.db import transaction
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist
 from django.http import StreamingHttpResponse
-from rest_framework import status
+from rest_framework import serializers, status
 
+from apps.agents.api.v1.serializers import ConversationSerializer
 from apps.agents.models import Conversation, Message
-from apps.agents.figents.v1.conversation import ConversationAgent
-from apps.agents.figents.v1.invoice import InvoiceAgent
 from apps.agents.intents import LLMIntentRouter, AgentIntent
 
+if TYPE_CHECKING:
+    from apps.agents.figents.v1.conversation import ConversationAgent
+
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+_TITLE_MAX_LENGTH = 50
+# Enough single-character words to exceed _TITLE_MAX_LENGTH once joined with spaces
+_TITLE_MAX_WORDS = _TITLE_MAX_LENGTH // 2 + 1
+
+# Formats datetimes exactly as the model serializers do (timezone, "Z" suffix)
+_DATETIME_FIELD = serializers.DateTimeField()
+
+
+@cache
+def _agent_classes():
+    """
+    Import the agent classes on first use.
+
+    They pull in CrewAI and the Gemini SDK, which workers that never serve a chat
+    request (and management commands) should not pay for at startup.
+    """
+    # pylint: disable=import-outside-toplevel
+    from apps.agents.figents.v1.conversation import ConversationAgent
+    from apps.agents.figents.v1.invoice import InvoiceAgent
+
+    return ConversationAgent, InvoiceAgent
+
 
 class ConversationService:
     """Service for managing conversations and messages with integrated agent handling."""
@@ -63,6 +89,7 @@ class ConversationService:
                     workspace_id, user, conversation_id, agent_type, llm_provider, message_content
                 )
 
+                # Saved before the agent runs, so created_at records when the message was sent
                 user_message = Message.objects.create(
                     conversation=conversation,
                     user=user,
@@ -90,9 +117,7 @@ class ConversationService:
                     user_message.content, conversation_context
                 )
 
-                intent_value = agent_response.get("intent")
-                if hasattr(intent_value, "intent_name"):
-                    intent_value = intent_value.intent_name
+                intent_value = _intent_name(agent_response.get("intent"))
 
                 workspace_id_str = (
                     str(agent_response.get("workspace_id", ""))
@@ -159,9 +184,10 @@ class ConversationService:
 
     def get_conversation_agent(
         self, workspace_id: str, llm_provider: str = "gemini"
-    ) -> ConversationAgent:
+    ) -> "ConversationAgent":
         """Initialize and return a configured ConversationAgent instance."""
         try:
+            ConversationAgent, InvoiceAgent = _agent_classes()  # pylint: disable=invalid-name
             invoice_agent = InvoiceAgent(workspace_id, llm_provider)
             conversation_agent = ConversationAgent(
                 workspace_id=workspace_id,
@@ -201,23 +227,30 @@ class ConversationService:
     def _generate_conversation_title(self, first_message: str) -> str:
         """Generate a concise, single-line title from the first message content."""
         try:
-            title = " ".join(first_message.strip().split())[:50]
-            if len(first_message) > 50:
+            stripped = first_message.strip()
+            # Only tokenize as many words as can fill the title; the unsplit remainder
+            # of long pastes is dropped without being scanned.
+            words = stripped.split(None, _TITLE_MAX_WORDS)[:_TITLE_MAX_WORDS]
+            title = " ".join(words)[:_TITLE_MAX_LENGTH]
+            if len(stripped) > _TITLE_MAX_LENGTH:
                 title += "..."
             return title or "New Conversation"
         except Exception as exc:
             logger.error("Error generating conversation title: %s", exc, exc_info=True)
             return "New Conversation"
 
-    def get_streaming_agent_response(
+    async def get_streaming_agent_response(
         self,
         user_message: Message,
-        conversation_agent: ConversationAgent,
+        conversation_agent: "ConversationAgent",
         conversation_context: Dict[str, Any],
-    ) -> Generator[Dict[str, Any], None, None]:
+    ) -> AsyncGenerator[Dict[str, Any], None]:
         """
         Stream the agent response chunks from conversation agent.
 
+        The agent's blocking generator is advanced in a worker thread, so the event loop
+        stays free while the LLM is producing tokens.
+
         On final chunk, create and save the agent response message.
 
         Yields:
@@ -229,12 +262,15 @@ class ConversationService:
             confidence = None
             workspace_id = None
 
-            for chunk in conversation_agent.route_query_streaming(
-                user_query=user_message.content,
-                user_context=conversation_context,
+            async for chunk in _iterate_in_thread(
+                conversation_agent.route_query_streaming(
+                    user_query=user_message.content,
+                    user_context=conversation_context,
+                )
             ):
-                if intent_value is None:
-                    intent_value = chunk.get("intent")
+                # Routing metadata arrives once; later token chunks skip the lookups
+                if intent_value is None and "intent" in chunk:
+                    intent_value = _intent_name(chunk["intent"])
                     confidence = chunk.get("confidence")
                     workspace_id = chunk.get("workspace_id")
 
@@ -246,13 +282,10 @@ class ConversationService:
 
                 if chunk.get("done", False):
                     try:
-                        if hasattr(intent_value, "intent_name"):
-                            intent_value = intent_value.intent_name
-
                         if workspace_id is not None:
                             workspace_id = str(workspace_id)
 
-                        agent_message = Message.objects.create(
+                        agent_message = await Message.objects.acreate(
                             conversation=user_message.conversation,
                             user=user_message.user,
                             role=Message.ROLE_AGENT,
@@ -266,7 +299,7 @@ class ConversationService:
                             },
                         )
 
-                        user_message.conversation.save()
+                        await user_message.conversation.asave()
                         logger.info(
                             "Created streaming agent response message %s for user %s.",
                             agent_message.id,
@@ -311,6 +344,14 @@ class ConversationService:
         """
         Create a streaming response for agent conversations.
 
+        The initial frame is serialized synchronously while still in the view; the agent
+        chunks are then produced by an async generator, so under ASGI a stream does not
+        hold a worker thread for the whole generation.
+
+        Streaming is ASGI-only (run.py / uvicorn). Under WSGI (config/wsgi.py) Django
+        consumes the whole async iterator before sending, so the client receives every
+        frame at once when the agent finishes.
+
         Args:
             user_message: The user message object
             conversation_agent: The conversation agent instance
@@ -323,18 +364,27 @@ class ConversationService:
         """
         from apps.core.utils.json import safe_chunk_for_json
 
-        def stream_response():
-            # Yield initial data first
+        if (
+            initial_data_type == "conversation"
+            and initial_serializer_class is ConversationSerializer
+        ):
+            # The conversation and its latest message are already in memory
+            initial_data = _serialize_conversation_fast(user_message.conversation, user_message)
+        else:
             if initial_data_type == "conversation":
                 serializer = initial_serializer_class(user_message.conversation)
             else:  # message
                 serializer = initial_serializer_class(user_message, include_user=True)
+            initial_data = safe_chunk_for_json(serializer.data)
 
-            data = safe_chunk_for_json(serializer.data)
-            yield f"data: {json.dumps({'type': initial_data_type, 'data': data})}\n\n"
+        initial_frame = f"data: {json.dumps({'type': initial_data_type, 'data': initial_data})}\n\n"
+
+        async def stream_response():
+            # Yield initial data first
+            yield initial_frame
 
             # Stream agent response chunks with safe serialization
-            for chunk in self.get_streaming_agent_response(
+            async for chunk in self.get_streaming_agent_response(
                 user_message, conversation_agent, conversation_context
             ):
                 chunk_type = "complete" if chunk.get("done", False) else "chunk"
@@ -348,5 +398,55 @@ class ConversationService:
         )
 
 
+def _intent_name(intent: Any) -> Any:
+    """Return the intent's name when given an ``AgentIntent``, else the value unchanged."""
+    return intent.intent_name if isinstance(intent, AgentIntent) else intent
+
+
+def _serialize_conversation_fast(
+    conversation: Conversation, last_message: Message
+) -> Dict[str, Any]:
+    """
+    Build the ``ConversationSerializer`` payload without going through DRF.
+
+    Args:
+        conversation: Conversation to serialize.
+        last_message: The conversation's most recent message, already saved.
+
+    Returns:
+        Dict with the same keys and formatting as ``ConversationSerializer(conversation).data``.
+    """
+    return {
+        "id": str(conversation.id),
+        "user": str(conversation.user_id),
+        "title": conversation.title,
+        "agent_type": conversation.agent_type,
+        "llm_provider": conversation.llm_provider,
+        "last_message": {
+            "id": str(last_message.id),
+            "role": last_message.role,
+            "content": last_message.content,
+            "user": str(last_message.user_id),
+            "agent_type": last_message.agent_type,
+            "metadata": last_message.metadata,
+            "created_at": _DATETIME_FIELD.to_representation(last_message.created_at),
+        },
+        "metadata": conversation.metadata,
+        "created_at": _DATETIME_FIELD.to_representation(conversation.created_at),
+        "updated_at": _DATETIME_FIELD.to_representation(conversation.updated_at),
+    }
+
+
+async def _iterate_in_thread(iterator: Iterator[Any]) -> AsyncGenerator[Any, None]:
+    """Drive a blocking iterator from async code, one ``next()`` per worker-thread hop."""
+    sentinel = object()
+    advance = sync_to_async(next, thread_sensitive=False)
+    while True:
+        item = await advance(iterator, sentinel)
+        if item is sentinel:
+            break
+        yield item
+
+
 # Global singleton service instance
 conversation_service = ConversationService()
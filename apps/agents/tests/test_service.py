@@ -0,0 +1,75 @@
+"""
+Tests for the conversation service
+"""
+
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.agents.api.v1.serializers import ConversationSerializer
+from apps.agents.intents import AgentIntent
+from apps.agents.models import Conversation, Message
+from apps.agents.service import ConversationService, _serialize_conversation_fast
+from apps.core.utils.json import safe_chunk_for_json
+from apps.users.models import User
+from apps.workspaces.models import Workspace
+
+
+class CreateMessageTests(TestCase):
+    """
+    Synchronous replies are stored after the user message that prompted them.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create(identifier="owner@example.com")
+        self.workspace, _ = Workspace.objects.create(name="Acme", created_by=self.user)
+        self.service = ConversationService()
+        self.asked_at = None
+
+    def route_query(self, user_query, user_context):  # pylint: disable=unused-argument
+        """Stand-in for the LLM call that records when it ran."""
+        self.asked_at = timezone.now()
+        return {"response": "Hello!", "intent": AgentIntent.GENERAL, "confidence": 0.9}
+
+    def test_user_message_is_stored_before_the_agent_replies(self):
+        agent = mock.Mock(route_query=mock.Mock(side_effect=self.route_query))
+        with mock.patch.object(self.service, "get_conversation_agent", return_value=agent):
+            reply = self.service.create_message(str(self.workspace.id), self.user, "Hi there")
+
+        user_message, agent_message = reply.conversation.messages.all()
+        self.assertEqual(
+            [user_message.role, agent_message.role], [Message.ROLE_USER, Message.ROLE_AGENT]
+        )
+        self.assertEqual(agent_message.id, reply.id)
+        self.assertLessEqual(user_message.created_at, self.asked_at)
+        self.assertLessEqual(self.asked_at, agent_message.created_at)
+
+
+class SerializeConversationFastTests(TestCase):
+    """
+    The initial SSE frame matches what ConversationSerializer would have produced.
+    """
+
+    def test_matches_conversation_serializer(self):
+        user = User.objects.create(identifier="owner@example.com")
+        workspace, _ = Workspace.objects.create(name="Acme", created_by=user)
+        conversation = Conversation.objects.create(
+            workspace=workspace, user=user, title="Invoices", metadata={"source": "web"}
+        )
+        Message.objects.create(
+            conversation=conversation, user=user, role=Message.ROLE_USER, content="First"
+        )
+        last_message = Message.objects.create(
+            conversation=conversation,
+            user=user,
+            role=Message.ROLE_USER,
+            content="Second",
+            agent_type="general",
+            metadata={"tokens": 3},
+        )
+
+        self.assertEqual(
+            _serialize_conversation_fast(conversation, last_message),
+            safe_chunk_for_json(ConversationSerializer(conversation).data),
+        )
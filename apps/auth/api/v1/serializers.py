@@ -3,7 +3,7 @@ Auth API v1 serializers
 """
 
 from rest_framework import serializers
-from apps.core.utils.identifier import is_valid_identifier
+from apps.core.utils.identifier import MAX_IDENTIFIER_LENGTH, is_valid_identifier
 
 
 class IdentifierSerializer(serializers.Serializer):
@@ -11,7 +11,7 @@ class IdentifierSerializer(serializers.Serializer):
     Serializer for identifier.
     """
 
-    identifier = serializers.CharField(required=True)
+    identifier = serializers.CharField(required=True, max_length=MAX_IDENTIFIER_LENGTH)
 
     def validate_identifier(self, value):
         """
@@ -10,8 +10,7 @@ from rest_framework.permissions import AllowAny
 from drf_spectacular.utils import extend_schema
 from apps.auth.api.v1.serializers import SendCodeSerializer, VerifyCodeSerializer, RefreshTokenSerializer
 from apps.auth.service import AuthService
-from apps.core.services.otp import OTPService
-from apps.core.services.email import EmailService
+from apps.core.services.otp import get_otp_service
 
 
 @extend_schema(tags=["Auth"])
@@ -22,9 +21,8 @@ class AuthViewSet(viewsets.GenericViewSet):
 
     permission_classes = [AllowAny]
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.auth_service = AuthService(otp_service=OTPService(email_service=EmailService()))
+    # Stateless services, built once and shared by every request
+    auth_service = AuthService(otp_service=get_otp_service())
 
     @action(detail=False, methods=["post"], url_path="send-code")
     def send_code(self, request):
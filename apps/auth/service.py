@@ -8,7 +8,7 @@ from typing import Optional
 from django.db import transaction
 from rest_framework_simplejwt.tokens import RefreshToken, TokenError
 from rest_framework.exceptions import ValidationError
-from apps.core.services.otp import OTPService
+from apps.core.services.otp import OTPService, OTPServiceBusy
 from apps.workspaces.models.workspace import Workspace
 from apps.users.models import User
 
@@ -104,6 +104,9 @@ class AuthService:
                 return OTPResult(request_id=request_id, success=True, message="OTP sent")
             else:
                 return OTPResult(request_id=None, success=False, message="Failed to generate OTP")
+        except OTPServiceBusy:
+            # Surfaced to the client as a 503 so it can retry
+            raise
         except Exception as e:
             logger.error("send_code failed to create/send OTP: %s", e, exc_info=True)
             return OTPResult(request_id=None, success=False, message="Internal error sending OTP")
@@ -0,0 +1,43 @@
+"""
+Tests for the send-code endpoint
+"""
+
+import queue
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from rest_framework.test import APIClient
+
+from apps.auth.api.v1.views import AuthViewSet
+
+SEND_CODE_URL = "/api/v1/auth/send-code/"
+
+
+class SendCodeTests(SimpleTestCase):
+    """
+    send-code reports an overloaded OTP queue as 503 instead of a 200 without request_id.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.dispatcher = AuthViewSet.auth_service.otp_service.dispatcher
+
+    def test_full_otp_queue_returns_503(self):
+        with mock.patch.object(self.dispatcher, "submit", side_effect=queue.Full):
+            response = APIClient().post(
+                SEND_CODE_URL, {"identifier": "user@example.com"}, format="json"
+            )
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()["code"], 503)
+
+    def test_queued_code_returns_request_id(self):
+        with mock.patch.object(self.dispatcher, "submit") as submit:
+            response = APIClient().post(
+                SEND_CODE_URL, {"identifier": "user@example.com"}, format="json"
+            )
+
+        self.assertEqual(response.status_code, 200)
+        request_id = response.json()["request_id"]
+        submit.assert_called_once_with("user@example.com", mock.ANY, request_id)
@@ -0,0 +1,25 @@
+"""
+Tests for the auth serializers
+"""
+
+from django.test import SimpleTestCase
+
+from apps.auth.api.v1.serializers import SendCodeSerializer
+from apps.core.utils.identifier import MAX_IDENTIFIER_LENGTH
+
+
+class IdentifierSerializerTests(SimpleTestCase):
+    """
+    Identifiers longer than any valid one are refused by the field itself.
+    """
+
+    def test_over_long_identifier_is_rejected_by_length(self):
+        serializer = SendCodeSerializer(data={"identifier": "a" * (MAX_IDENTIFIER_LENGTH + 1)})
+
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(serializer.errors["identifier"][0].code, "max_length")
+
+    def test_valid_identifier_is_accepted(self):
+        serializer = SendCodeSerializer(data={"identifier": "user@example.com"})
+
+        self.assertTrue(serializer.is_valid(), serializer.errors)
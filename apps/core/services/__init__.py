@@ -1 +1 @@
-__all__ = ["otp", "email"]
+__all__ = ["otp", "otp_dispatcher", "email", "email_pool"]
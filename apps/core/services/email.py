@@ -3,15 +3,27 @@ Email service for sending emails asynchronously in background threads.
 """
 
 import logging
-import threading
-from typing import Dict, Any, Optional, Sequence
-from django.core.mail import send_mail, EmailMultiAlternatives
+import smtplib
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+from django.core.mail import EmailMessage, EmailMultiAlternatives
+from django.template import TemplateDoesNotExist
 from django.template.loader import render_to_string
 from django.conf import settings
 from django.utils.html import strip_tags
 
+from apps.core.services.email_pool import (
+    EXECUTOR,
+    deliver_on_thread_connection,
+    reset_connection,
+)
+
 logger = logging.getLogger(__name__)
 
+_OTP_TEMPLATE = "otp_verification"
+
+# The server answered and rejected one message; the connection is still usable
+_MESSAGE_REJECTED = (smtplib.SMTPRecipientsRefused, smtplib.SMTPResponseException)
+
 
 class EmailService:
     """
@@ -36,15 +48,22 @@ class EmailService:
             html_message (Optional[str]): HTML version of email body, if provided
             sender (str): Sender email address
         """
-        try:
+
+        def deliver(connection):
             if html_message:
-                email = EmailMultiAlternatives(subject, message, sender, recipients)
+                email = EmailMultiAlternatives(
+                    subject, message, sender, recipients, connection=connection
+                )
                 email.attach_alternative(html_message, "text/html")
-                email.send()
             else:
-                send_mail(subject, message, sender, recipients)
+                email = EmailMessage(subject, message, sender, recipients, connection=connection)
+            email.send()
+
+        try:
+            deliver_on_thread_connection(deliver)
             logger.info("Email sent to %s", recipients)
         except Exception as e:
+            reset_connection()
             logger.error("Failed to send email to %s: %s", recipients, e, exc_info=True)
 
     @classmethod
@@ -72,14 +91,37 @@ class EmailService:
             bool: Always returns True as sending is initiated asynchronously.
                 Check logs for actual delivery status.
         """
+        # Snapshot the recipients so the worker never sees later mutations or a spent iterator
+        recipients = tuple(recipients)
         sender = from_email or settings.DEFAULT_FROM_EMAIL
-        threading.Thread(
-            target=cls._send_email_task,
-            args=(subject, message, recipients, html_message, sender),
-            daemon=True,
-        ).start()
+        EXECUTOR.submit(cls._send_email_task, subject, message, recipients, html_message, sender)
         return True
 
+    @staticmethod
+    def _render_template(
+        template_name: str, context: Dict[str, Any], text_message: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """
+        Render the HTML and plain text bodies of a template email.
+
+        Args:
+            template_name (str): Base name of the template (without extension)
+            context (Dict[str, Any]): Template context variables for rendering
+            text_message (Optional[str], optional): Precomputed plain text body.
+                If not provided, the text template is rendered, falling back to the
+                HTML body with tags stripped when no text template exists.
+
+        Returns:
+            Tuple[str, str]: The HTML body and the plain text body.
+        """
+        html_message = render_to_string(f"{template_name}.html", context)
+        if text_message is None:
+            try:
+                text_message = render_to_string(f"{template_name}.txt", context)
+            except TemplateDoesNotExist:
+                text_message = strip_tags(html_message)
+        return html_message, text_message
+
     @classmethod
     def send_template_email(
         cls,
@@ -88,6 +130,7 @@ class EmailService:
         subject: str,
         recipients: Sequence[str],
         from_email: Optional[str] = None,
+        text_message: Optional[str] = None,
     ) -> bool:
         """
         Send an email using Django templates for content generation.
@@ -102,14 +145,16 @@ class EmailService:
             recipients (Sequence[str]): List of recipient email addresses
             from_email (Optional[str], optional): Sender email address.
                 If not provided, uses DEFAULT_FROM_EMAIL from settings.
+            text_message (Optional[str], optional): Precomputed plain text body.
+                If not provided, the text template is rendered, falling back to the
+                HTML body with tags stripped when no text template exists.
                 
         Returns:
             bool: True if template rendering and email sending initiated successfully,
                 False if template rendering failed.
         """
         try:
-            html_message = render_to_string(f"{template_name}.html", context)
-            text_message = strip_tags(html_message)
+            html_message, text_message = cls._render_template(template_name, context, text_message)
             return cls.send_email(subject, text_message, recipients, html_message, from_email)
         except Exception as e:
             logger.error(
@@ -134,6 +179,78 @@ class EmailService:
         Returns:
             bool: True if email sending was initiated successfully, False otherwise
         """
+        context, subject, text_message = cls._otp_email_content(otp, request_id)
+        logger.info("Sending OTP email to %s", email)
+
+        return cls.send_template_email(
+            _OTP_TEMPLATE, context, subject, [email], text_message=text_message
+        )
+
+    @classmethod
+    def send_bulk_otp_emails(
+        cls, batch: Sequence[Tuple[str, str, str]]
+    ) -> List[Optional[Exception]]:
+        """
+        Send a batch of OTP emails synchronously over the calling thread's connection.
+
+        Meant to be called from a background worker; every message in the batch goes
+        out over one already-open connection instead of paying a round trip of
+        connection setup per email. Messages are sent one at a time, so a refused
+        recipient fails only its own message, and a dropped connection is reopened to
+        resend only the message that was in flight.
+
+        Args:
+            batch (Sequence[Tuple[str, str, str]]): (email, otp, request_id) tuples
+
+        Returns:
+            List[Optional[Exception]]: One entry per batch item, in order: None if the
+                message was sent, else the error that stopped it.
+        """
+        sender = settings.DEFAULT_FROM_EMAIL
+        results: List[Optional[Exception]] = []
+        for email, otp, request_id in batch:
+            try:
+                context, subject, text_message = cls._otp_email_content(otp, request_id)
+                html_message, text_message = cls._render_template(
+                    _OTP_TEMPLATE, context, text_message
+                )
+                message = EmailMultiAlternatives(subject, text_message, sender, [email])
+                message.attach_alternative(html_message, "text/html")
+                # Bind this message now; the retry inside must resend it and nothing else
+                sent = deliver_on_thread_connection(
+                    lambda connection, message=message: connection.send_messages([message])
+                )
+                if not sent:
+                    raise smtplib.SMTPException("Message was not accepted for delivery")
+            except Exception as e:  # pylint: disable=broad-except
+                if not isinstance(e, _MESSAGE_REJECTED):
+                    reset_connection()
+                logger.error(
+                    "Failed to send OTP email to %s (request_id=%s): %s", email, request_id, e
+                )
+                results.append(e)
+            else:
+                results.append(None)
+
+        logger.info(
+            "Sent %d of %d OTP emails in one batch",
+            results.count(None),
+            len(results),
+        )
+        return results
+
+    @staticmethod
+    def _otp_email_content(otp: str, request_id: str) -> Tuple[Dict[str, Any], str, str]:
+        """
+        Build the template context, subject and plain text body of an OTP email.
+
+        Args:
+            otp (str): The OTP code to include in the email
+            request_id (str): Unique identifier for tracking this OTP request
+
+        Returns:
+            Tuple[Dict[str, Any], str, str]: The context, subject and text body.
+        """
         context = {
             "otp": otp,
             "request_id": request_id,
@@ -141,6 +258,8 @@ class EmailService:
             "support_email": getattr(settings, "SUPPORT_EMAIL", settings.DEFAULT_FROM_EMAIL),
         }
         subject = f"{otp} is your verification code"
-        logger.info("Sending OTP email to %s", email)
-
-        return cls.send_template_email("otp_verification", context, subject, [email])
+        text_message = (
+            f"{otp} is your sign-in code. It expires in {context['expiry_minutes']} minutes.\n\n"
+            "If you didn't request this code, you can safely ignore this email."
+        )
+        return context, subject, text_message
@@ -0,0 +1,52 @@
+"""
+Worker pool and persistent per-thread mail connections for outgoing email.
+"""
+
+import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.core import mail
+
+# Background workers for outgoing mail; each worker keeps its own connection open
+# so the SMTP/TLS handshake is paid once per worker instead of once per email.
+EXECUTOR = ThreadPoolExecutor(
+    max_workers=getattr(settings, "EMAIL_WORKERS", 4), thread_name_prefix="email"
+)
+
+_connection_local = threading.local()
+
+
+def get_connection():
+    """Return the calling thread's open mail connection, opening one if needed."""
+    conn = getattr(_connection_local, "conn", None)
+    if conn is None:
+        conn = mail.get_connection()
+        conn.open()
+        _connection_local.conn = conn
+    return conn
+
+
+def reset_connection() -> None:
+    """Close and forget the calling thread's mail connection."""
+    conn = getattr(_connection_local, "conn", None)
+    if conn is None:
+        return
+    del _connection_local.conn
+    try:
+        conn.close()
+    except Exception:  # pylint: disable=broad-except
+        pass
+
+
+def deliver_on_thread_connection(deliver):
+    """
+    Call ``deliver(connection)`` with the calling thread's mail connection.
+
+    If the server dropped the idle connection, the call is retried once on a fresh one.
+    """
+    try:
+        return deliver(get_connection())
+    except smtplib.SMTPServerDisconnected:
+        reset_connection()
+        return deliver(get_connection())
@@ -2,39 +2,115 @@
 OTP service
 """
 
-import uuid
-import secrets
+import functools
+import os
+import hmac
 import logging
+import queue
 import threading
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import NamedTuple, Optional, Dict
 from django.core.cache import cache
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from rest_framework import status
+from rest_framework.exceptions import APIException
 
 from apps.core.services.email import EmailService
+from apps.core.services.otp_dispatcher import OTPDispatcher
 from apps.core.utils.identifier import get_identifier_type
 
 logger = logging.getLogger(__name__)
 
+# Random bytes are read from the OS in blocks and handed out per thread, so generating
+# an OTP costs a slice of a buffer rather than a getrandom() call per digit.
+_ENTROPY_BUFFER_SIZE = 2048
+# Largest multiple of 10 that fits in a byte; higher bytes are rejected to avoid bias
+_DIGIT_BYTE_LIMIT = 250
+# bytes.translate tables: drop biased bytes, map the rest to ASCII digits in one C call
+_DIGIT_TABLE = bytes(0x30 + byte % 10 for byte in range(256))
+_REJECTED_BYTES = bytes(range(_DIGIT_BYTE_LIMIT, 256))
+_entropy = threading.local()
+
+
+def _reset_entropy() -> None:
+    """Drop all buffered entropy, so a forked child never reuses its parent's bytes."""
+    global _entropy  # pylint: disable=global-statement
+    _entropy = threading.local()
+
+
+os.register_at_fork(after_in_child=_reset_entropy)
+
+
+def _random_bytes(size: int) -> bytes:
+    """
+    Return ``size`` cryptographically secure random bytes from the thread's buffer.
+
+    Args:
+        size (int): Number of bytes to return.
+
+    Returns:
+        bytes: Fresh random bytes, never handed out before.
+    """
+    buf = getattr(_entropy, "buf", None)
+    pos = getattr(_entropy, "pos", 0)
+    if buf is None or pos + size > len(buf):
+        buf = _entropy.buf = os.urandom(max(_ENTROPY_BUFFER_SIZE, size))
+        pos = 0
+    _entropy.pos = pos + size
+    return buf[pos : pos + size]
+
+
+def _uuid4_bytes() -> bytearray:
+    """Return 16 buffered random bytes with the RFC 4122 version 4 and variant bits set."""
+    raw = bytearray(_random_bytes(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40
+    raw[8] = (raw[8] & 0x3F) | 0x80
+    return raw
+
+
+class OTPServiceBusy(APIException):
+    """
+    Raised when the OTP email queue is full; rendered by DRF as a 503.
+    """
+
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Too many verification codes are being sent. Please try again shortly."
+    default_code = "otp_service_busy"
+
+
+class OTPData(NamedTuple):
+    """
+    OTP record stored for a request.
+    """
+
+    otp: str
+    identifier: str
+
 
 class OTPService:
     """
     Service for managing OTP lifecycle operations.
     """
 
-    def __init__(self, email_service: EmailService):
+    def __init__(self, email_service: EmailService, dispatcher: Optional[OTPDispatcher] = None):
         """
         Initialize the OTPService with required dependencies.
 
         Args:
             email_service (EmailService): Service instance for sending emails.
                 Must be configured with proper email settings.
+            dispatcher (Optional[OTPDispatcher], optional): Dispatcher batching OTP emails.
+                If not provided, one delivering through email_service is created.
 
         Raises:
             TypeError: If email_service is not an EmailService instance.
         """
         self.email_service = email_service
+        if dispatcher is None:
+            dispatcher = OTPDispatcher(
+                email_service, max_pending=getattr(settings, "OTP_MAX_PENDING", 1000)
+            )
+        self.dispatcher = dispatcher
 
     def generate_otp(self) -> str:
         """
@@ -46,7 +122,12 @@ class OTPService:
         length = getattr(settings, "OTP_LENGTH", 6)
         if settings.DEBUG:
             return "0" * length
-        return "".join(str(secrets.randbelow(10)) for _ in range(length))
+
+        digits = b""
+        while len(digits) < length:
+            # Two bytes per digit leaves headroom for the rare rejected byte
+            digits += _random_bytes(length * 2).translate(_DIGIT_TABLE, _REJECTED_BYTES)
+        return digits[:length].decode("ascii")
 
     def generate_request_id(self) -> str:
         """
@@ -55,7 +136,8 @@ class OTPService:
         Returns:
             str: A unique UUID4 string (e.g., "550e8400-e29b-41d4-a716-446655440000")
         """
-        return str(uuid.uuid4())
+        digits = _uuid4_bytes().hex()
+        return f"{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}"
 
     def get_identifier_type_or_raise(self, identifier: str) -> str:
         """
@@ -83,18 +165,13 @@ class OTPService:
         """
         expiry_minutes = getattr(settings, "OTP_EXPIRY_MINUTES", 5)
         cache_timeout = expiry_minutes * 60
-        now_iso = datetime.utcnow().isoformat()
-
-        otp_data = {
-            "otp": otp,
-            "identifier": identifier,
-            "created_at": now_iso,
-            "expires_at": (datetime.utcnow() + timedelta(minutes=expiry_minutes)).isoformat(),
-        }
-        cache.set(f"otp:{request_id}", otp_data, cache_timeout)
+
+        # Packed as b"<otp>|<identifier>"; expiry is carried by the cache timeout
+        payload = f"{otp}|{identifier}".encode()
+        cache.set(f"otp:{request_id}", payload, cache_timeout)
         logger.debug("Stored OTP for request_id=%s with expiry %s minutes", request_id, expiry_minutes)
 
-    def get_otp_data(self, request_id: str) -> Optional[Dict[str, Any]]:
+    def get_otp_data(self, request_id: str) -> Optional[OTPData]:
         """
         Retrieve OTP data from cache using request_id.
 
@@ -102,10 +179,13 @@ class OTPService:
             request_id (str): Unique identifier for the OTP request
 
         Returns:
-            Optional[Dict[str, Any]]: OTP data dictionary if found and not expired,
-                None otherwise.
+            Optional[OTPData]: OTP data if found and not expired, None otherwise.
         """
-        return cache.get(f"otp:{request_id}")
+        payload = cache.get(f"otp:{request_id}")
+        if payload is None:
+            return None
+        otp, identifier = payload.decode().split("|", 1)
+        return OTPData(otp, identifier)
 
     def validate_otp(self, identifier: str, request_id: str, provided_otp: str) -> bool:
         """
@@ -130,7 +210,11 @@ class OTPService:
             logger.warning("No OTP data found for request_id=%s", request_id)
             return False
 
-        is_valid = otp_data.get("otp") == provided_otp and otp_data.get("identifier") == identifier
+        # Constant-time code comparison, so response timing reveals nothing about the code
+        is_valid = (
+            hmac.compare_digest(otp_data.otp.encode(), str(provided_otp).encode())
+            and otp_data.identifier == identifier
+        )
         if is_valid:
             logger.info("OTP validated successfully for request_id=%s", request_id)
             cache.delete(f"otp:{request_id}")
@@ -150,17 +234,14 @@ class OTPService:
 
         Returns:
             bool: True if OTP sending was initiated successfully, False otherwise
+
+        Raises:
+            queue.Full: If too many OTP emails are already waiting to be sent.
         """
         identifier_type = self.get_identifier_type_or_raise(identifier)
         if identifier_type == "email":
-
-            def send_async():
-                try:
-                    self.email_service.send_otp_email(identifier, otp, request_id)
-                except Exception as e:
-                    logger.error("Failed to send OTP email to %s: %s", identifier, e, exc_info=True)
-
-            threading.Thread(target=send_async, daemon=True).start()
+            # Batched with other pending OTPs; delivery failures are logged by the dispatcher
+            self.dispatcher.submit(identifier, otp, request_id)
             return True
         else:
             raise NotImplementedError("Identifier type not supported for OTP")
@@ -174,12 +255,35 @@ class OTPService:
 
         Returns:
             Dict[str, str]: Dictionary containing the request_id for tracking.
+
+        Raises:
+            OTPServiceBusy: If the OTP email queue is full; no code is left stored.
         """
         self.get_identifier_type_or_raise(identifier)
 
         request_id = self.generate_request_id()
         otp = self.generate_otp()
         self.store_otp(request_id, identifier, otp)
-        self.send_otp(identifier, otp, request_id)
+        try:
+            self.send_otp(identifier, otp, request_id)
+        except queue.Full as exc:
+            # The code was never sent, so it must not stay valid
+            cache.delete(f"otp:{request_id}")
+            raise OTPServiceBusy() from exc
 
         return {"request_id": request_id}
+
+
+# Qualified, as a bare ``cache`` here is Django's cache
+@functools.cache
+def get_otp_service() -> OTPService:
+    """
+    Return the process-wide OTPService.
+
+    One instance, and so one OTP dispatcher and its worker threads, serves every
+    request.
+
+    Returns:
+        OTPService: The shared OTP service.
+    """
+    return OTPService(email_service=EmailService())
@@ -0,0 +1,153 @@
+"""
+Group-commit dispatcher for OTP emails.
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Tuple
+
+from apps.core.services.email import EmailService
+
+logger = logging.getLogger(__name__)
+
+_Job = Tuple[str, str, str, Future]
+
+
+class OTPDispatcher:
+    """
+    Collects OTP emails from request threads and sends them in batches.
+
+    Worker threads block on a shared queue; once a job arrives, a worker keeps collecting
+    until it holds ``max_batch`` jobs or ``max_wait`` seconds have passed, then sends the
+    whole batch over its mail connection. With two workers, one can be collecting while
+    the other waits on the mail server.
+
+    The queue is bounded: when the mail server falls behind, submitters wait briefly
+    for room and are then refused, instead of piling up unsent work without limit.
+    """
+
+    def __init__(
+        self,
+        email_service: EmailService,
+        max_batch: int = 64,
+        max_wait: float = 0.01,
+        workers: int = 2,
+        max_pending: int = 1000,
+        submit_timeout: float = 0.5,
+    ):
+        """
+        Initialize the dispatcher. Worker threads are started on the first submission.
+
+        Args:
+            email_service (EmailService): Service used to deliver each batch.
+            max_batch (int): Largest number of emails sent in one batch.
+            max_wait (float): Seconds to keep collecting after the first job of a batch.
+            workers (int): Number of worker threads flushing batches concurrently.
+            max_pending (int): Most emails allowed to wait in the queue.
+            submit_timeout (float): Seconds a submission waits for room in a full queue.
+        """
+        self.email_service = email_service
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.workers = workers
+        self.submit_timeout = submit_timeout
+        self.max_pending = max_pending
+        self._queue: "queue.Queue[_Job]" = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._started = False
+        os.register_at_fork(after_in_child=self._reset_after_fork)
+
+    def submit(self, identifier: str, otp: str, request_id: str) -> Future:
+        """
+        Queue an OTP email for delivery.
+
+        Args:
+            identifier (str): Recipient email address
+            otp (str): The OTP code to send
+            request_id (str): Unique identifier for tracking this OTP request
+
+        Returns:
+            Future: Resolves to True once the batch holding this email is sent, or
+                carries the delivery error.
+
+        Raises:
+            queue.Full: If the queue stayed full for ``submit_timeout`` seconds.
+        """
+        self._ensure_started()
+        future: Future = Future()
+        try:
+            self._queue.put((identifier, otp, request_id, future), timeout=self.submit_timeout)
+        except queue.Full:
+            logger.warning(
+                "OTP email queue is full (%d pending), refusing request_id=%s",
+                self.pending,
+                request_id,
+            )
+            raise
+        return future
+
+    @property
+    def pending(self) -> int:
+        """Approximate number of emails waiting to be sent."""
+        return self._queue.qsize()
+
+    def _reset_after_fork(self) -> None:
+        """
+        Forget the parent's workers and queue in a forked child.
+
+        Threads do not survive a fork, so the child starts its own workers on its first
+        submission; jobs copied from the parent's queue stay with the parent.
+        """
+        self._queue = queue.Queue(maxsize=self.max_pending)
+        self._lock = threading.Lock()
+        self._started = False
+
+    def _ensure_started(self) -> None:
+        """Start the worker threads once per process."""
+        if self._started:
+            return
+        with self._lock:
+            if self._started:
+                return
+            for index in range(self.workers):
+                threading.Thread(
+                    target=self._run, name=f"otp-dispatcher-{index}", daemon=True
+                ).start()
+            self._started = True
+
+    def _run(self) -> None:
+        """Worker loop: wait for a job, collect a batch around it, flush it."""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._flush(batch)
+
+    def _flush(self, batch: List[_Job]) -> None:
+        """Send one batch and resolve each future from its own message's outcome."""
+        try:
+            errors = self.email_service.send_bulk_otp_emails(
+                [(identifier, otp, request_id) for identifier, otp, request_id, _ in batch]
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error("Failed to send batch of %d OTP emails: %s", len(batch), e, exc_info=True)
+            for *_, future in batch:
+                future.set_exception(e)
+            return
+
+        for (*_, future), error in zip(batch, errors):
+            if error is None:
+                future.set_result(True)
+            else:
+                future.set_exception(error)
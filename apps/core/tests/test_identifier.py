@@ -0,0 +1,29 @@
+"""
+Tests for identifier classification
+"""
+
+from django.test import SimpleTestCase
+
+from apps.core.utils.identifier import (
+    MAX_IDENTIFIER_LENGTH,
+    get_identifier_type,
+    is_valid_identifier,
+)
+
+
+class IdentifierTypeTests(SimpleTestCase):
+    """
+    Identifiers are classified as email or phone, and anything else is rejected.
+    """
+
+    def test_classifies_email_and_phone(self):
+        self.assertEqual(get_identifier_type("user@example.com"), "email")
+        self.assertEqual(get_identifier_type("  user@example.com\n"), "email")
+        self.assertEqual(get_identifier_type("+14155550123"), "phone")
+
+    def test_rejects_malformed_and_out_of_bounds_values(self):
+        too_long = "a" * (MAX_IDENTIFIER_LENGTH - len("@example.com") + 1) + "@example.com"
+        for value in ("user@", "12345", "a@b", too_long, "x" * 2_000_000):
+            with self.subTest(value=value[:20]):
+                self.assertIsNone(get_identifier_type(value))
+                self.assertFalse(is_valid_identifier(value))
@@ -0,0 +1,116 @@
+"""
+Tests for the OTP service
+"""
+
+import os
+import queue
+import unittest
+from collections import Counter
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from apps.core.services import otp as otp_module
+from apps.core.services.email import EmailService
+from apps.core.services.otp import OTPService, OTPServiceBusy
+
+
+class OTPGenerationTests(SimpleTestCase):
+    """
+    OTP codes are fixed-length digit strings drawn from fresh entropy.
+    """
+
+    def setUp(self):
+        self.service = OTPService(EmailService(), dispatcher=object())
+
+    def test_code_has_configured_length_and_only_digits(self):
+        for length in (4, 6, 8):
+            with self.subTest(length=length), override_settings(OTP_LENGTH=length):
+                for _ in range(200):
+                    code = self.service.generate_otp()
+                    self.assertEqual(len(code), length)
+                    self.assertTrue(code.isdigit())
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_forked_child_does_not_reuse_buffered_entropy(self):
+        # pylint: disable=protected-access
+        # Start a fresh buffer, then note the bytes the parent will hand out next
+        otp_module._reset_entropy()
+        otp_module._random_bytes(16)
+        entropy = otp_module._entropy
+        parent_next = entropy.buf[entropy.pos : entropy.pos + 16]
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            try:
+                os.close(read_fd)
+                os.write(write_fd, otp_module._random_bytes(16))
+            finally:
+                os._exit(0)
+
+        os.close(write_fd)
+        with os.fdopen(read_fd, "rb") as pipe:
+            child_bytes = pipe.read()
+        os.waitpid(pid, 0)
+
+        self.assertEqual(len(child_bytes), 16)
+        self.assertNotEqual(child_bytes, parent_next)
+        # The parent's own buffer is untouched by the fork
+        self.assertEqual(otp_module._random_bytes(16), parent_next)
+
+
+class OTPDigitMappingTests(SimpleTestCase):
+    """
+    Entropy bytes map uniformly onto digits, keeping leading zeros.
+    """
+
+    def setUp(self):
+        self.service = OTPService(EmailService(), dispatcher=object())
+
+    def test_accepted_bytes_cover_each_digit_equally(self):
+        # pylint: disable=protected-access
+        digits = bytes(range(256)).translate(otp_module._DIGIT_TABLE, otp_module._REJECTED_BYTES)
+
+        self.assertEqual(len(digits), otp_module._DIGIT_BYTE_LIMIT)
+        self.assertEqual(Counter(digits), {ord(digit): 25 for digit in "0123456789"})
+
+    @override_settings(OTP_LENGTH=6)
+    def test_rejected_bytes_are_skipped_and_leading_zeros_kept(self):
+        draws = [
+            # Only two usable bytes (0 and 10); the rest are rejected
+            bytes([250, 0, 251, 252, 10, 253, 254, 255, 250, 251, 252, 253]),
+            bytes([20, 9, 255, 19, 30, 249, 1, 2, 3, 4, 5, 6]),
+        ]
+        with mock.patch.object(otp_module, "_random_bytes", side_effect=draws) as random_bytes:
+            code = self.service.generate_otp()
+
+        self.assertEqual(code, "000990")
+        self.assertEqual(random_bytes.call_count, 2)
+
+
+class _FullDispatcher:
+    """Dispatcher stand-in whose queue is always full."""
+
+    def submit(self, identifier, otp, request_id):
+        raise queue.Full
+
+
+class OTPServiceBusyTests(SimpleTestCase):
+    """
+    OTP codes are only kept for requests whose email was queued.
+    """
+
+    def setUp(self):
+        cache.clear()
+
+    def test_full_queue_raises_busy_and_keeps_no_code(self):
+        service = OTPService(EmailService(), dispatcher=_FullDispatcher())
+        service.generate_request_id = lambda: "request-1"
+
+        with self.assertRaises(OTPServiceBusy) as raised:
+            service.create_and_send_otp("user@example.com")
+
+        self.assertEqual(raised.exception.status_code, 503)
+        self.assertIsNone(service.get_otp_data("request-1"))
@@ -0,0 +1,92 @@
+"""
+Tests for batched OTP delivery
+"""
+
+import smtplib
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend as LocmemEmailBackend
+from django.test import SimpleTestCase, override_settings
+
+from apps.core.services.email import EmailService
+from apps.core.services.otp_dispatcher import OTPDispatcher
+
+REFUSED_ADDRESS = "refused@example.com"
+_dropped_once = set()
+
+
+class RefusingEmailBackend(LocmemEmailBackend):
+    """
+    Locmem backend whose server refuses REFUSED_ADDRESS, raising like the SMTP backend.
+    """
+
+    def send_messages(self, email_messages):
+        for message in email_messages:
+            if REFUSED_ADDRESS in message.to:
+                raise smtplib.SMTPRecipientsRefused({REFUSED_ADDRESS: (550, b"No such user")})
+        return super().send_messages(email_messages)
+
+
+class DroppingEmailBackend(LocmemEmailBackend):
+    """
+    Locmem backend that drops the connection the first time it sees each address.
+    """
+
+    def send_messages(self, email_messages):
+        for message in email_messages:
+            if message.to[0] not in _dropped_once:
+                _dropped_once.add(message.to[0])
+                raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        return super().send_messages(email_messages)
+
+
+def collect(futures):
+    """Wait for each future and return its result, or the type of its exception."""
+    outcomes = []
+    for future in futures:
+        try:
+            outcomes.append(future.result(timeout=5))
+        except Exception as exc:  # pylint: disable=broad-except
+            outcomes.append(type(exc))
+    return outcomes
+
+
+class OTPDispatcherTests(SimpleTestCase):
+    """
+    Each submitted OTP email succeeds or fails on its own, whatever batch it lands in.
+    """
+
+    def setUp(self):
+        mail.outbox = []
+        self.dispatcher = OTPDispatcher(EmailService(), max_wait=0.05, workers=1)
+
+    @override_settings(EMAIL_BACKEND="apps.core.tests.test_otp_dispatcher.RefusingEmailBackend")
+    def test_refused_recipient_fails_only_its_own_message(self):
+        addresses = [f"user{index}@example.com" for index in range(6)]
+        addresses.insert(3, REFUSED_ADDRESS)
+
+        futures = [
+            self.dispatcher.submit(address, "123456", f"request-{index}")
+            for index, address in enumerate(addresses)
+        ]
+
+        expected = [True] * len(addresses)
+        expected[3] = smtplib.SMTPRecipientsRefused
+        self.assertEqual(collect(futures), expected)
+        self.assertEqual(
+            sorted(message.to[0] for message in mail.outbox),
+            sorted(address for address in addresses if address != REFUSED_ADDRESS),
+        )
+
+    @override_settings(EMAIL_BACKEND="apps.core.tests.test_otp_dispatcher.DroppingEmailBackend")
+    def test_dropped_connection_resends_only_the_message_in_flight(self):
+        _dropped_once.clear()
+        addresses = [f"user{index}@example.com" for index in range(4)]
+
+        futures = [
+            self.dispatcher.submit(address, "123456", f"request-{index}")
+            for index, address in enumerate(addresses)
+        ]
+
+        self.assertEqual(collect(futures), [True] * len(addresses))
+        self.assertEqual(sorted(message.to[0] for message in mail.outbox), addresses)
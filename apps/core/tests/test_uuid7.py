@@ -0,0 +1,43 @@
+"""
+Tests for UUID version 7 generation
+"""
+
+import time
+import uuid
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from apps.core.utils.uuid7 import uuid7
+
+
+class UUID7Tests(SimpleTestCase):
+    """
+    Generated ids are RFC 9562 version 7 UUIDs that sort by creation time.
+    """
+
+    def test_version_variant_and_timestamp(self):
+        before_ms = time.time_ns() // 1_000_000
+        value = uuid7()
+        after_ms = time.time_ns() // 1_000_000
+
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.variant, uuid.RFC_4122)
+        self.assertTrue(before_ms <= value.int >> 80 <= after_ms)
+
+    def test_later_milliseconds_sort_later(self):
+        start_ns = 1_760_000_000_000 * 1_000_000
+        clock = iter(range(start_ns, start_ns + 500 * 1_000_000, 1_000_000))
+        with mock.patch("apps.core.utils.uuid7.time.time_ns", side_effect=lambda: next(clock)):
+            values = [uuid7() for _ in range(500)]
+
+        self.assertEqual(values, sorted(values))
+        self.assertEqual(sorted(values, key=str), values)
+
+    def test_values_are_unique_within_a_millisecond(self):
+        with mock.patch(
+            "apps.core.utils.uuid7.time.time_ns", return_value=1_760_000_000_000_000_000
+        ):
+            values = {uuid7() for _ in range(1000)}
+
+        self.assertEqual(len(values), 1000)
@@ -4,29 +4,30 @@ Identifier validation and type identification utilities.
 
 import re
 
-_EMAIL_PATTERN = re.compile(r"^[\w\.-]+@[\w\.-]+\.\w+$")
-_PHONE_PATTERN = re.compile(r"^\+?\d{7,15}$")
+# One pass decides both validity and type; the matching group's name is the type
+_IDENTIFIER_PATTERN = re.compile(r"(?P<email>[\w.-]+@[\w.-]+\.\w+)|(?P<phone>\+?\d{7,15})")
+
+# Shortest ("a@b.c") and longest (RFC 5321 path limit) identifiers worth matching
+_MIN_IDENTIFIER_LENGTH = 5
+MAX_IDENTIFIER_LENGTH = 254
 
 
 def is_valid_identifier(value: str) -> bool:
     """
     Validate the identifier.
     """
-    if not isinstance(value, str) or not value.strip():
+    if not isinstance(value, str):
         return False
+    return get_identifier_type(value) is not None
 
-    value = value.strip()
-    if _EMAIL_PATTERN.match(value) or _PHONE_PATTERN.match(value):
-        return True
-    return False
 
 def get_identifier_type(value: str) -> str | None:
     """
     Get the type of the identifier.
     """
     value = value.strip()
-    if _EMAIL_PATTERN.match(value):
-        return "email"
-    if _PHONE_PATTERN.match(value):
-        return "phone"
-    return None
+    if not _MIN_IDENTIFIER_LENGTH <= len(value) <= MAX_IDENTIFIER_LENGTH:
+        return None
+
+    match = _IDENTIFIER_PATTERN.fullmatch(value)
+    return match.lastgroup if match else None
@@ -5,17 +5,25 @@ JSON utilities for safe serialization
 import uuid
 from datetime import datetime, date, time
 from decimal import Decimal
+from functools import cache
 
+from django.utils.functional import Promise
 
-def safe_chunk_for_json(chunk: dict) -> dict:
+# JsonResponse dump options matching DRF's default JSONRenderer output
+COMPACT_JSON_DUMPS_PARAMS = {"separators": (",", ":"), "ensure_ascii": False}
+
+
+@cache
+def _converters() -> dict:
     """
-    Convert any non-serializable objects in chunk to JSON-friendly formats.
-    Handles AgentIntent instances, UUIDs, and other common non-serializable types.
+    Build the converter table, keyed by exact type, on first use.
+
+    AgentIntent is imported here rather than at module level, so core and config
+    modules importing this one do not depend on the agents app.
     """
     from apps.agents.intents import AgentIntent  # pylint: disable=import-outside-toplevel
 
-    # Type converter mapping for cleaner code
-    type_converters = {
+    return {
         AgentIntent: lambda x: x.intent_name,
         uuid.UUID: str,
         datetime: lambda x: x.isoformat(),
@@ -24,6 +32,39 @@ def safe_chunk_for_json(chunk: dict) -> dict:
         Decimal: float,
     }
 
+
+@cache
+def _converter_for(value_type: type):
+    """Return the converter for a type (nearest match along its MRO), or None."""
+    converters = _converters()
+    for base in value_type.__mro__:
+        converter = converters.get(base)
+        if converter is not None:
+            return converter
+    return None
+
+
+def orjson_default(value):
+    """
+    Fallback for types orjson does not serialize natively.
+
+    orjson already handles str subclasses (DRF's ErrorDetail), datetime, date, time and
+    UUID; this covers the rest the way DjangoJSONEncoder does.
+
+    Raises:
+        TypeError: If the value has no JSON representation.
+    """
+    if isinstance(value, (Decimal, Promise)):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def safe_chunk_for_json(chunk: dict) -> dict:
+    """
+    Convert any non-serializable objects in chunk to JSON-friendly formats.
+    Handles AgentIntent instances, UUIDs, and other common non-serializable types.
+    """
+
     def convert_value(value):
         """Recursively convert non-serializable values to JSON-friendly formats"""
         # Handle collections first
@@ -32,10 +73,10 @@ def safe_chunk_for_json(chunk: dict) -> dict:
         elif isinstance(value, (list, tuple)):
             return [convert_value(item) for item in value]
 
-        # Handle specific types using the converter mapping
-        for type_class, converter in type_converters.items():
-            if isinstance(value, type_class):
-                return converter(value)
+        # One cached lookup per type instead of an isinstance scan per value
+        converter = _converter_for(type(value))
+        if converter is not None:
+            return converter(value)
 
         # Return as-is for JSON-serializable types
         return value
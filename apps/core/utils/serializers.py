@@ -0,0 +1,26 @@
+"""
+Serializer utilities
+"""
+
+import copy
+
+
+class CachedFieldsMixin:
+    """
+    Build a serializer class's fields once and give each instance shallow copies.
+
+    ModelSerializer rebuilds its fields from model introspection and deep-copies the
+    declared fields every time a serializer is instantiated. For read-only serializers
+    whose fields never depend on the instance, the result can be built once per class.
+    Each instance still binds its own copies, so field state is never shared.
+
+    Only use it on serializers whose get_fields() output depends on the class alone.
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        cached = cls.__dict__.get("_cached_fields")
+        if cached is None:
+            cached = super().get_fields()
+            cls._cached_fields = cached
+        return {name: copy.copy(field) for name, field in cached.items()}
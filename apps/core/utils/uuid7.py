@@ -0,0 +1,28 @@
+"""
+Time-ordered UUID (version 7) generation.
+"""
+
+import os
+import time
+import uuid
+
+_RAND_B_MASK = (1 << 62) - 1
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a UUID version 7 as laid out in RFC 9562.
+
+    The leading 48 bits hold the Unix time in milliseconds, so values created later
+    sort after earlier ones and new rows land at the right edge of a B-tree index.
+
+    Returns:
+        uuid.UUID: A new version 7 UUID.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    rand_a = (rand >> 62) & 0xFFF
+    rand_b = rand & _RAND_B_MASK
+    return uuid.UUID(
+        int=(timestamp_ms & 0xFFFFFFFFFFFF) << 80 | 0x7 << 76 | rand_a << 64 | 0b10 << 62 | rand_b
+    )
@@ -2,21 +2,47 @@
 Invoice serializers
 """
 
+from typing import Any, Dict, Iterable, List
+from django.db.models import QuerySet
 from rest_framework import serializers
 from apps.invoices.models import Invoice
 from apps.users.api.v1.serializers import UserSimpleSerializer
-from apps.workspaces.models import Workspace
 
+# Standalone fields reused to format list rows exactly like the model serializer does
+_DATETIME_FIELD = serializers.DateTimeField()
+_AMOUNT_FIELD = serializers.DecimalField(
+    max_digits=Invoice._meta.get_field("amount").max_digits,
+    decimal_places=Invoice._meta.get_field("amount").decimal_places,
+)
 
-class InvoiceSerializer(serializers.ModelSerializer):
+_BULK_VALUE_FIELDS = (
+    "id",
+    "description",
+    "amount",
+    "status",
+    "type",
+    "due_date",
+    "paid_date",
+    "file_url",
+    "created_at",
+    "updated_at",
+    "created_by_id",
+    "created_by__email",
+    "created_by__phone",
+    "created_by__first_name",
+    "created_by__last_name",
+)
+
+
+class InvoiceCompactSerializer(serializers.ModelSerializer):
     """
-    Invoice serializer with optional nested user representation for created_by.
+    Invoice serializer representing created_by by its id.
     """
 
-    created_by = serializers.SerializerMethodField()
+    created_by = serializers.PrimaryKeyRelatedField(read_only=True)
 
     class Meta:
-        """Meta class for InvoiceSerializer."""
+        """Meta class for InvoiceCompactSerializer."""
 
         model = Invoice
         fields = [
@@ -34,23 +60,6 @@ class InvoiceSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "created_at", "updated_at", "created_by"]
 
-    def __init__(self, *args, include_user=False, **kwargs):
-        """
-        Optionally include serialized user data for created_by.
-        Default: Only user ID.
-        """
-        self.include_user = include_user
-        super().__init__(*args, **kwargs)
-
-    def get_created_by(self, obj):
-        """Get the created_by user."""
-        if self.include_user:
-            # Return user detail serialization
-            return UserSimpleSerializer(obj.created_by, context=self.context).data
-        else:
-            # Return only user id
-            return obj.created_by_id
-
     def create(self, validated_data):
         """Create an invoice."""
         workspace_id = self.context.get("workspace_id")
@@ -59,11 +68,76 @@ class InvoiceSerializer(serializers.ModelSerializer):
         if not workspace_id or not created_by:
             raise serializers.ValidationError("workspace_id and created_by must be set.")
 
-        workspace = Workspace.objects.get(id=workspace_id)
-        if not workspace:
-            raise serializers.ValidationError("Workspace not found.")
-
-        validated_data["workspace"] = workspace
+        # IsWorkspaceMember already proved the workspace exists; the FK only needs its id
+        validated_data["workspace_id"] = workspace_id
         validated_data["created_by"] = created_by
 
         return super().create(validated_data)
+
+
+class InvoiceListSerializer(InvoiceCompactSerializer):
+    """
+    Invoice serializer with the nested user representation for created_by.
+    """
+
+    created_by = UserSimpleSerializer(read_only=True)
+
+    @staticmethod
+    def bulk_values(queryset: QuerySet) -> QuerySet:
+        """
+        Narrow an invoice queryset to the rows read by ``bulk_representation``.
+
+        Args:
+            queryset (QuerySet): Invoices to list.
+
+        Returns:
+            QuerySet: A values() queryset joining each invoice's creator.
+        """
+        return queryset.values(*_BULK_VALUE_FIELDS)
+
+    @staticmethod
+    def bulk_representation(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Build list representations from ``bulk_values`` rows without per-field dispatch.
+
+        The output matches ``InvoiceListSerializer(..., many=True).data``.
+
+        Args:
+            rows (Iterable[Dict[str, Any]]): Rows produced by ``bulk_values``.
+
+        Returns:
+            List[Dict[str, Any]]: One dict per invoice with the creator nested.
+        """
+        to_datetime = _DATETIME_FIELD.to_representation
+        to_amount = _AMOUNT_FIELD.to_representation
+        user_cache: Dict[Any, Dict[str, Any]] = {}
+
+        def created_by(row):
+            # Rows by the same creator share one nested dict
+            user = user_cache.get(row["created_by_id"])
+            if user is None:
+                user = user_cache[row["created_by_id"]] = {
+                    "id": str(row["created_by_id"]),
+                    "email": row["created_by__email"],
+                    "phone": row["created_by__phone"],
+                    "first_name": row["created_by__first_name"],
+                    "last_name": row["created_by__last_name"],
+                }
+            return user
+
+        return [
+            {
+                "id": str(row["id"]),
+                "description": row["description"],
+                "amount": to_amount(row["amount"]),
+                "status": row["status"],
+                "type": row["type"],
+                "due_date": to_datetime(row["due_date"]) if row["due_date"] else None,
+                "paid_date": to_datetime(row["paid_date"]) if row["paid_date"] else None,
+                "file_url": row["file_url"],
+                "created_at": to_datetime(row["created_at"]),
+                "updated_at": to_datetime(row["updated_at"]),
+                "created_by": created_by(row),
+            }
+            for row in rows
+        ]
@@ -9,7 +9,7 @@ from rest_framework import status
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema
 from apps.invoices.models import Invoice
-from apps.invoices.api.v1.serializers import InvoiceSerializer
+from apps.invoices.api.v1.serializers import InvoiceCompactSerializer, InvoiceListSerializer
 from apps.workspaces.permissions import IsWorkspaceMember
 
 
@@ -21,22 +21,31 @@ class InvoiceViewSet(viewsets.GenericViewSet):
 
     permission_classes = [IsAuthenticated, IsWorkspaceMember]
 
+    def get_serializer_class(self):
+        """
+        Nest the creator for the list and create actions; other actions get its id.
+        """
+        if self.action in ("get_list", "create_new"):
+            return InvoiceListSerializer
+        return InvoiceCompactSerializer
+
     @action(detail=False, methods=["GET"], url_path="list")
     def get_list(self, request, workspace_id=None):
         """
         Get invoices for a specific workspace by workspace_id path parameter.
         """
-        invoices = Invoice.objects.filter(workspace_id=workspace_id)
+        # Read plain rows (creator joined in) and shape them without DRF's per-field dispatch
+        invoices = InvoiceListSerializer.bulk_values(
+            Invoice.objects.filter(workspace_id=workspace_id)
+        )
 
         # Use DRF pagination if configured globally
         page = self.paginate_queryset(invoices)
         if page is not None:
-            serializer = InvoiceSerializer(page, many=True, include_user=True)
-            return self.get_paginated_response(serializer.data)
+            return self.get_paginated_response(InvoiceListSerializer.bulk_representation(page))
 
         # Fallback: no pagination
-        serializer = InvoiceSerializer(invoices, many=True, include_user=True)
-        return Response(serializer.data)
+        return Response(InvoiceListSerializer.bulk_representation(invoices))
 
     @action(detail=False, methods=["POST"], url_path="create")
     def create_new(self, request, workspace_id=None):
@@ -48,10 +57,9 @@ class InvoiceViewSet(viewsets.GenericViewSet):
         data["workspace_id"] = workspace_id
 
         created_by = request.user
-        serializer = InvoiceSerializer(
+        serializer = self.get_serializer_class()(
             data=data,
             context={"workspace_id": workspace_id, "created_by": created_by},
-            include_user=True,
         )
         serializer.is_valid(raise_exception=True)
         serializer.save()
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-15 12:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('invoices', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='invoice',
+            index=models.Index(fields=['workspace', '-created_at'], name='inv_ws_created_idx'),
+        ),
+    ]
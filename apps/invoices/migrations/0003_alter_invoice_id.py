@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-15 12:05
+
+import apps.core.utils.uuid7
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('invoices', '0002_invoice_inv_ws_created_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='invoice',
+            name='id',
+            field=models.UUIDField(default=apps.core.utils.uuid7.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -2,8 +2,8 @@
 Invoices models
 """
 
-import uuid
 from django.db import models
+from apps.core.utils.uuid7 import uuid7
 from apps.workspaces.models.workspace import Workspace
 from apps.users.models import User
 
@@ -70,7 +70,8 @@ class Invoice(models.Model):
     Invoice model
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # Time-ordered ids keep inserts at the right edge of the primary key index
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     workspace = models.ForeignKey(Workspace, on_delete=models.CASCADE)
     description = models.TextField(blank=True)
     amount = models.DecimalField(max_digits=10, decimal_places=2)
@@ -94,6 +95,9 @@ class Invoice(models.Model):
         verbose_name = "Invoice"
         verbose_name_plural = "Invoices"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["workspace", "-created_at"], name="inv_ws_created_idx"),
+        ]
 
     def __str__(self):
         """
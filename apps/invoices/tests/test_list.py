@@ -0,0 +1,90 @@
+"""
+Tests for the invoice list endpoint
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.invoices.api.v1.serializers import InvoiceListSerializer
+from apps.invoices.models import Invoice, InvoiceStatus
+from apps.users.models import User
+from apps.workspaces.models import Workspace, WorkspaceRoleType
+
+
+class InvoiceListTestCase(TestCase):
+    """
+    Base test case with a workspace, two members and a helper to add invoices.
+    """
+
+    def setUp(self):
+        self.owner = User.objects.create(identifier="owner@example.com", first_name="Ada")
+        self.member = User.objects.create(identifier="member@example.com")
+        self.workspace, _ = Workspace.objects.create(name="Acme", created_by=self.owner)
+        Workspace.objects.add_user(self.workspace, self.member, WorkspaceRoleType.MEMBER)
+        self.url = f"/api/v1/workspaces/{self.workspace.id}/invoices/list/"
+
+    def add_invoices(self, count, **kwargs):
+        """Create invoices alternating between the two members."""
+        for index in range(count):
+            Invoice.objects.create_invoice(
+                self.workspace,
+                self.owner if index % 2 else self.member,
+                description=f"Invoice {index}",
+                amount=Decimal("10.50") * (index + 1),
+                **kwargs,
+            )
+
+    def list_invoices(self):
+        """GET the invoice list as the owner, with no cached role lookup."""
+        cache.clear()
+        client = APIClient()
+        client.force_authenticate(user=self.owner)
+        return client.get(self.url)
+
+
+class InvoiceListQueryTests(InvoiceListTestCase):
+    """
+    Invoice creators are joined into the list query instead of loaded per row.
+    """
+
+    def test_query_count_does_not_grow_with_rows(self):
+        self.add_invoices(1)
+        with CaptureQueriesContext(connection) as one_row:
+            self.assertEqual(self.list_invoices().status_code, 200)
+
+        self.add_invoices(9)
+        with CaptureQueriesContext(connection) as many_rows:
+            response = self.list_invoices()
+
+        self.assertEqual(response.json()["count"], 10)
+        self.assertEqual(len(many_rows), len(one_row))
+
+
+class InvoiceBulkRepresentationTests(InvoiceListTestCase):
+    """
+    The hand-built list rows match InvoiceListSerializer field for field.
+    """
+
+    def test_matches_list_serializer(self):
+        self.add_invoices(3)
+        self.add_invoices(
+            2,
+            status=InvoiceStatus.PAID,
+            due_date=datetime(2026, 1, 31, 9, 30, tzinfo=timezone.utc),
+            paid_date=datetime(2026, 2, 1, 17, 5, 12, 345678, tzinfo=timezone.utc),
+            file_url="https://files.example.com/invoice.pdf",
+        )
+        invoices = Invoice.objects.filter(workspace=self.workspace)
+
+        rows = InvoiceListSerializer.bulk_representation(
+            InvoiceListSerializer.bulk_values(invoices)
+        )
+
+        self.assertEqual(rows, InvoiceListSerializer(invoices, many=True).data)
+        self.assertEqual(self.list_invoices().json()["results"], rows)
@@ -2,11 +2,25 @@
 Workspace API serializers
 """
 
+from typing import Any, Dict, Iterable, List
+from django.db.models import QuerySet
 from rest_framework import serializers
-from apps.workspaces.models.workspace import Workspace, WorkspaceRole
+from apps.core.utils.serializers import CachedFieldsMixin
+from apps.workspaces.models import Workspace, WorkspaceRole
 
+# Formats list rows' datetimes exactly like the serializer fields do
+_DATETIME_FIELD = serializers.DateTimeField()
 
-class WorkspaceRoleSerializer(serializers.ModelSerializer):
+_ROLE_VALUE_FIELDS = ("id", "type", "created_at", "updated_at", "workspace_id")
+_ROLE_WORKSPACE_VALUE_FIELDS = _ROLE_VALUE_FIELDS + (
+    "workspace__name",
+    "workspace__description",
+    "workspace__created_at",
+    "workspace__updated_at",
+)
+
+
+class WorkspaceRoleSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for WorkspaceRole model.
     Optionally includes nested workspace details.
@@ -18,7 +32,8 @@ class WorkspaceRoleSerializer(serializers.ModelSerializer):
         """Meta class for WorkspaceRoleSerializer."""
         model = WorkspaceRole
         fields = ["id", "type", "created_at", "updated_at", "workspace"]
-        read_only_fields = ["id", "created_at", "updated_at"]
+        # Only used to render roles, never to write them
+        read_only_fields = fields
 
     def __init__(self, *args, **kwargs):
         """
@@ -32,7 +47,7 @@ class WorkspaceRoleSerializer(serializers.ModelSerializer):
         """Get the workspace for this role."""
         if not self.include_workspace:
             # Return only workspace ID if not including full details.
-            return str(obj.workspace.id)
+            return str(obj.workspace_id)
 
         # Full workspace details
         return {
@@ -43,6 +58,67 @@ class WorkspaceRoleSerializer(serializers.ModelSerializer):
             "updated_at": obj.workspace.updated_at,
         }
 
+    @staticmethod
+    def bulk_values(queryset: QuerySet, include_workspace: bool = False) -> QuerySet:
+        """
+        Narrow a role queryset to the rows read by ``bulk_representation``.
+
+        Args:
+            queryset (QuerySet): Roles to list.
+            include_workspace (bool): Whether to join the workspace details in.
+
+        Returns:
+            QuerySet: A values() queryset.
+        """
+        fields = _ROLE_WORKSPACE_VALUE_FIELDS if include_workspace else _ROLE_VALUE_FIELDS
+        return queryset.values(*fields)
+
+    @staticmethod
+    def bulk_representation(
+        rows: Iterable[Dict[str, Any]], include_workspace: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Build list representations from ``bulk_values`` rows without per-field dispatch.
+
+        The output matches ``WorkspaceRoleSerializer(..., many=True).data`` with the same
+        ``include_workspace`` flag.
+
+        Args:
+            rows (Iterable[Dict[str, Any]]): Rows produced by ``bulk_values``.
+            include_workspace (bool): Whether the rows carry workspace details.
+
+        Returns:
+            List[Dict[str, Any]]: One dict per role.
+        """
+        to_datetime = _DATETIME_FIELD.to_representation
+        workspaces: Dict[Any, Dict[str, Any]] = {}
+
+        def workspace(row):
+            if not include_workspace:
+                return str(row["workspace_id"])
+            # Rows in the same workspace share one nested dict
+            details = workspaces.get(row["workspace_id"])
+            if details is None:
+                details = workspaces[row["workspace_id"]] = {
+                    "id": str(row["workspace_id"]),
+                    "name": row["workspace__name"],
+                    "description": row["workspace__description"],
+                    "created_at": to_datetime(row["workspace__created_at"]),
+                    "updated_at": to_datetime(row["workspace__updated_at"]),
+                }
+            return details
+
+        return [
+            {
+                "id": str(row["id"]),
+                "type": row["type"],
+                "created_at": to_datetime(row["created_at"]),
+                "updated_at": to_datetime(row["updated_at"]),
+                "workspace": workspace(row),
+            }
+            for row in rows
+        ]
+
 
 class WorkspaceSerializer(serializers.ModelSerializer):
     """
@@ -70,6 +146,6 @@ class WorkspaceSerializer(serializers.ModelSerializer):
         """Get the roles for this workspace if requested."""
         if not self.include_roles:
             return None
-        roles = WorkspaceRole.objects.filter(workspace=obj)
+        roles = WorkspaceRole.objects.filter(workspace=obj).order_by("type", "updated_at")
         serializer = WorkspaceRoleSerializer(roles, many=True, context=self.context)
         return serializer.data
@@ -2,11 +2,19 @@
 Workspace API views
 """
 
+from django.core.cache import cache
+from django.http import JsonResponse
 from rest_framework import viewsets
-from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.decorators import action
 from drf_spectacular.utils import extend_schema
+from config.pagination import WorkspaceCursorPagination
+from apps.core.utils.json import COMPACT_JSON_DUMPS_PARAMS
+from apps.workspaces.cache import (
+    USER_ROLES_CACHE_TIMEOUT,
+    cross_request_cache_enabled,
+    user_roles_cache_key,
+)
 from apps.workspaces.permissions import IsWorkspaceMember
 from apps.workspaces.models.roles import WorkspaceRole
 from apps.workspaces.api.v1.serializers import WorkspaceRoleSerializer
@@ -25,11 +33,22 @@ class UserWorkspaceViewSet(viewsets.GenericViewSet):
         """
         Retrieve all workspace roles assigned to the current user.
         """
-        workspace_roles = WorkspaceRole.objects.filter(user=request.user)
-        serializer = WorkspaceRoleSerializer(
-            workspace_roles, many=True, context=self.get_serializer_context()
-        )
-        return Response(serializer.data)
+
+        def build():
+            rows = WorkspaceRoleSerializer.bulk_values(
+                WorkspaceRole.objects.filter(user=request.user).order_by("type", "updated_at")
+            )
+            return WorkspaceRoleSerializer.bulk_representation(rows)
+
+        if cross_request_cache_enabled():
+            # Cached until one of the user's roles changes (see apps.workspaces.signals)
+            data = cache.get_or_set(
+                user_roles_cache_key(request.user.id), build, USER_ROLES_CACHE_TIMEOUT
+            )
+        else:
+            data = build()
+        # Plain JSON data, so skip DRF's renderer; same compact output as JSONRenderer
+        return JsonResponse(data, safe=False, json_dumps_params=COMPACT_JSON_DUMPS_PARAMS)
 
 
 @extend_schema(tags=["Workspaces"])
@@ -45,6 +64,7 @@ class WorkspaceViewSet(viewsets.GenericViewSet):
         methods=["GET"],
         url_path=r"(?P<workspace_id>[0-9a-f-]{36})/roles",
         permission_classes=[IsWorkspaceMember],
+        pagination_class=WorkspaceCursorPagination,
     )
     def get_workspace_roles(self, request, workspace_id=None):
         """
@@ -52,8 +72,18 @@ class WorkspaceViewSet(viewsets.GenericViewSet):
         Requires the user to be a member of the workspace.
         """
 
-        roles_qs = WorkspaceRole.objects.filter(workspace_id=workspace_id)
-        serializer = WorkspaceRoleSerializer(
-            roles_qs, many=True, include_workspace=True, context=self.get_serializer_context()
+        rows = WorkspaceRoleSerializer.bulk_values(
+            WorkspaceRole.objects.filter(workspace_id=workspace_id), include_workspace=True
+        )
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(
+                WorkspaceRoleSerializer.bulk_representation(page, include_workspace=True)
+            )
+
+        return JsonResponse(
+            WorkspaceRoleSerializer.bulk_representation(rows, include_workspace=True),
+            safe=False,
+            json_dumps_params=COMPACT_JSON_DUMPS_PARAMS,
         )
-        return Response(serializer.data)
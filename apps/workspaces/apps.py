@@ -13,3 +13,10 @@ class WorkspacesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.workspaces"
     label = "workspaces"
+
+    def ready(self):
+        """
+        Register signal handlers
+        """
+        # pylint: disable-next=import-outside-toplevel,unused-import
+        from apps.workspaces import signals  # noqa: F401
@@ -0,0 +1,49 @@
+"""
+Cache keys and helpers for workspace role lookups
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+
+# Seconds a user's role in a workspace stays cached across requests (shared backends only)
+ROLE_CACHE_TIMEOUT = 60
+# Seconds a user's rendered role listing stays cached (shared backends only)
+USER_ROLES_CACHE_TIMEOUT = 300
+
+# Backends whose entries live in a single process, out of reach of other workers
+_PROCESS_LOCAL_BACKENDS = frozenset(
+    {
+        "django.core.cache.backends.locmem.LocMemCache",
+        "django.core.cache.backends.dummy.DummyCache",
+    }
+)
+
+
+def cross_request_cache_enabled() -> bool:
+    """
+    Return True if role data may be cached across requests.
+
+    Role changes are invalidated only in the process that made them, so caching is
+    safe only when the default cache is shared by every worker (Redis, Memcached, ...).
+    """
+    return settings.CACHES["default"]["BACKEND"] not in _PROCESS_LOCAL_BACKENDS
+
+
+def role_cache_key(user_id, workspace_id) -> str:
+    """Return the cache key holding a user's role type in a workspace."""
+    return f"ws_mem:{user_id}:{workspace_id}"
+
+
+def invalidate_role(user_id, workspace_id) -> None:
+    """Drop the cached role of a user in a workspace."""
+    cache.delete(role_cache_key(user_id, workspace_id))
+
+
+def user_roles_cache_key(user_id) -> str:
+    """Return the cache key holding a user's rendered role listing."""
+    return f"uroles:{user_id}"
+
+
+def invalidate_user_roles(*user_ids) -> None:
+    """Drop the cached role listings of the given users."""
+    cache.delete_many([user_roles_cache_key(user_id) for user_id in user_ids])
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-15 12:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workspaces', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='workspacerole',
+            index=models.Index(fields=['workspace', '-updated_at', 'id'], name='ws_role_ws_updated_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-15 12:16
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workspaces', '0002_workspacerole_ws_role_ws_updated_idx'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='workspacerole',
+            options={'verbose_name': 'Workspace Role', 'verbose_name_plural': 'Workspace Roles'},
+        ),
+    ]
@@ -3,7 +3,7 @@ Workspace role models
 """
 
 import uuid
-from django.db import models
+from django.db import DatabaseError, IntegrityError, models, transaction
 from apps.users.models import User
 
 
@@ -23,16 +23,31 @@ class WorkspaceRoleManager(models.Manager):
 
     def create(self, user: User, workspace, role_type):
         """Create a new workspace role."""
-        if self.model.objects.filter(user=user, workspace=workspace).exists():
-            raise ValueError("User already has a role in the workspace")
-        return super().create(user=user, workspace=workspace, type=role_type)
+        # The (user, workspace) unique constraint rejects duplicates; the savepoint keeps
+        # an enclosing transaction usable after the failed INSERT.
+        try:
+            with transaction.atomic():
+                return super().create(user=user, workspace=workspace, type=role_type)
+        except IntegrityError as exc:
+            # Only a duplicate role is a user error; FK and NOT NULL violations (a deleted
+            # user or workspace) propagate unchanged.
+            if not self.filter(user=user, workspace=workspace).exists():
+                raise
+            raise ValueError("User already has a role in the workspace") from exc
 
     def update_role(self, role, role_type):
         """Update a workspace role."""
-        if not self.model.objects.filter(id=role.id).exists():
-            raise ValueError("Workspace role not found")
         role.type = role_type
-        role.save()
+        try:
+            # Only the changed columns are written; an UPDATE with update_fields fails when
+            # the row is gone, so no existence check is needed
+            role.save(update_fields=["type", "updated_at"])
+        except DatabaseError as exc:
+            # Django reports an UPDATE that matched no row with a bare DatabaseError;
+            # subclasses (connection or integrity failures) are not a missing role.
+            if type(exc) is not DatabaseError:  # pylint: disable=unidiomatic-typecheck
+                raise
+            raise ValueError("Workspace role not found") from exc
         return role
 
     def delete(self, role):
@@ -41,15 +56,15 @@ class WorkspaceRoleManager(models.Manager):
 
     def get_by_user_and_workspace(self, user: User, workspace):
         """Get a workspace role by user and workspace."""
-        return super().model.objects.get(user=user, workspace=workspace)
+        return self.get(user=user, workspace=workspace)
 
     def get_by_user(self, user: User):
         """Get all workspace roles by user."""
-        return super().model.objects.filter(user=user)
+        return self.filter(user=user).order_by("type", "updated_at")
 
     def get_by_workspace(self, workspace):
         """Get all workspace roles by workspace."""
-        return super().model.objects.filter(workspace=workspace)
+        return self.filter(workspace=workspace).order_by("type", "updated_at")
 
 
 class WorkspaceRole(models.Model):
@@ -94,7 +109,10 @@ class WorkspaceRole(models.Model):
         verbose_name = "Workspace Role"
         verbose_name_plural = "Workspace Roles"
         unique_together = ("user", "workspace")
-        ordering = ["type", "updated_at"]
+        indexes = [
+            # Serves the per-workspace role listing, cursor-paginated by (-updated_at, id)
+            models.Index(fields=["workspace", "-updated_at", "id"], name="ws_role_ws_updated_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.user} - {self.workspace} ({self.type})"
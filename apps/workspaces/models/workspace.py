@@ -4,6 +4,7 @@ Workspace models
 
 import uuid
 from django.db import models, transaction
+from apps.workspaces.cache import invalidate_user_roles
 from apps.workspaces.models.roles import WorkspaceRole, WorkspaceRoleType
 
 
@@ -28,6 +29,35 @@ class WorkspaceManager(models.Manager):
 
             return workspace, workspace_member
 
+    def bulk_create_with_owner(self, items):
+        """
+        Create many workspaces, each with its creator as owner, in two INSERTs.
+
+        Args:
+            items: Iterable of (name, created_by, description) tuples.
+
+        Returns:
+            Tuple of the created workspaces and their owner roles, in input order.
+        """
+        # Primary keys are generated on instantiation, so roles can reference them
+        # before anything is written.
+        workspaces = []
+        roles = []
+        for name, created_by, description in items:
+            workspace = self.model(name=name, description=description)
+            workspaces.append(workspace)
+            roles.append(
+                WorkspaceRole(user=created_by, workspace=workspace, type=WorkspaceRoleType.OWNER)
+            )
+
+        with transaction.atomic():
+            self.bulk_create(workspaces)
+            WorkspaceRole.objects.bulk_create(roles)
+
+        # bulk_create sends no post_save signals, so drop the owners' cached listings here
+        invalidate_user_roles(*{role.user_id for role in roles})
+        return workspaces, roles
+
     def add_user(self, workspace, user, role_type):
         """
         Add a user to a workspace with a role.
@@ -48,7 +78,7 @@ class WorkspaceManager(models.Manager):
         Get all users for a workspace.
         """
 
-        return WorkspaceRole.objects.filter(workspace=workspace)
+        return WorkspaceRole.objects.filter(workspace=workspace).order_by("type", "updated_at")
 
 
 class Workspace(models.Model):
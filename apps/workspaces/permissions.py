@@ -2,11 +2,54 @@
 Workspace Permissions with Role-Based Access Control
 """
 
-from django.core.exceptions import ObjectDoesNotExist
+from django.core.cache import cache
 from rest_framework.permissions import BasePermission
+from apps.workspaces.cache import ROLE_CACHE_TIMEOUT, cross_request_cache_enabled, role_cache_key
 from apps.workspaces.models.roles import WorkspaceRole, WorkspaceRoleType
 
 
+def _read_role_type(user_id, workspace_id):
+    """Read just the type column of a user's role, without instantiating a model."""
+    return (
+        WorkspaceRole.objects.filter(user_id=user_id, workspace_id=workspace_id)
+        .values_list("type", flat=True)
+        .first()
+    )
+
+
+def _get_role_type(request, workspace_id):
+    """
+    Return the requesting user's role type in a workspace, or None without a role.
+
+    Lookups are memoized on the request, so stacked permission classes share one
+    lookup. With a shared cache backend, found roles are also cached across requests
+    for ROLE_CACHE_TIMEOUT seconds; a process-local cache would keep serving revoked
+    roles on the workers that did not see the change. Missing roles are never cached,
+    so a newly added member is let in immediately.
+    """
+    memo = getattr(request, "_workspace_role_cache", None)
+    if memo is None:
+        memo = request._workspace_role_cache = {}  # pylint: disable=protected-access
+
+    user = request.user
+    key = (user.id, workspace_id)
+    if key in memo:
+        return memo[key]
+
+    if cross_request_cache_enabled():
+        cache_key = role_cache_key(*key)
+        role_type = cache.get(cache_key)
+        if role_type is None:
+            role_type = _read_role_type(*key)
+            if role_type is not None:
+                cache.set(cache_key, role_type, ROLE_CACHE_TIMEOUT)
+    else:
+        role_type = _read_role_type(*key)
+
+    memo[key] = role_type
+    return role_type
+
+
 class HasWorkspaceRole(BasePermission):
     """
     Allows access only if the user has one of the specified roles
@@ -16,35 +59,40 @@ class HasWorkspaceRole(BasePermission):
         permission_classes = [HasWorkspaceRole(roles=["owner", "member"])]
 
     Pass roles as a list of strings representing allowed roles.
+
+    The user's role type in the workspace (or None) is left on
+    ``request.workspace_role`` for the view to reuse.
     """
 
+    allowed_roles = frozenset()
+
     def __init__(self, roles=None):
-        if roles is None:
-            roles = []
-        self.allowed_roles = set(roles)
+        if roles is not None:
+            self.allowed_roles = frozenset(roles)
 
     def has_permission(self, request, view):
         workspace_id = view.kwargs.get("workspace_id")
         if not workspace_id:
             return False
 
-        try:
-            # Get the user's role in the workspace
-            workspace_role = WorkspaceRole.objects.get(user=request.user, workspace_id=workspace_id)
-            # Check if the user's role is in the allowed roles
-            return workspace_role.type in self.allowed_roles
-        except ObjectDoesNotExist:
+        # Anonymous users hold no roles; skip the lookup entirely
+        user = request.user
+        if user is None or not user.is_authenticated:
             return False
 
+        # Expose the role to the view so it never has to look it up again
+        request.workspace_role = _get_role_type(request, workspace_id)
+        # Check if the user's role in the workspace is in the allowed roles
+        return request.workspace_role in self.allowed_roles
+
 
 class IsWorkspaceMember(HasWorkspaceRole):
     """
     Checks if user is any member (has any role) in the workspace.
     """
 
-    def __init__(self):
-        # Allow any role type (owner or member)
-        super().__init__(roles=[WorkspaceRoleType.OWNER, WorkspaceRoleType.MEMBER])
+    # Allow any role type (owner or member)
+    allowed_roles = frozenset({WorkspaceRoleType.OWNER, WorkspaceRoleType.MEMBER})
 
 
 class IsWorkspaceOwner(HasWorkspaceRole):
@@ -52,5 +100,4 @@ class IsWorkspaceOwner(HasWorkspaceRole):
     Checks if user has the owner role in the workspace.
     """
 
-    def __init__(self):
-        super().__init__(roles=[WorkspaceRoleType.OWNER])
+    allowed_roles = frozenset({WorkspaceRoleType.OWNER})
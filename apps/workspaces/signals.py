@@ -0,0 +1,16 @@
+"""
+Workspace signal handlers
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.workspaces.cache import invalidate_role, invalidate_user_roles
+from apps.workspaces.models.roles import WorkspaceRole
+
+
+@receiver([post_save, post_delete], sender=WorkspaceRole)
+def invalidate_cached_role(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Forget the cached role and role listing whenever a workspace role is saved or deleted."""
+    invalidate_role(instance.user_id, instance.workspace_id)
+    invalidate_user_roles(instance.user_id)
@@ -0,0 +1,61 @@
+"""
+Shared fixtures for workspace tests
+"""
+
+import shutil
+import tempfile
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.users.models import User
+from apps.workspaces.models import Workspace
+
+MY_ROLES_URL = "/api/v1/workspaces/my-roles/"
+
+
+def workspace_roles_url(workspace):
+    """Return the role listing URL of a workspace."""
+    return f"/api/v1/workspaces/{workspace.id}/roles/"
+
+
+class WorkspaceTestCase(TestCase):
+    """
+    Base test case with an owner, a second user and a workspace owned by the first.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create(identifier="owner@example.com")
+        self.member = User.objects.create(identifier="member@example.com")
+        self.workspace, self.owner_role = Workspace.objects.create(
+            name="Acme", created_by=self.owner
+        )
+        self.client = APIClient()
+
+    def get_as(self, user, url):
+        """GET a URL authenticated as the given user."""
+        self.client.force_authenticate(user=user)
+        return self.client.get(url)
+
+
+class SharedCacheMixin:
+    """
+    Runs a test case against a file-based cache, which every process on a host shares.
+    """
+
+    def setUp(self):
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location, ignore_errors=True)
+        shared_cache = override_settings(
+            CACHES={
+                "default": {
+                    "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                    "LOCATION": location,
+                }
+            }
+        )
+        shared_cache.enable()
+        self.addCleanup(shared_cache.disable)
+        super().setUp()
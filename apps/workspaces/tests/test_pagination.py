@@ -0,0 +1,44 @@
+"""
+Tests for the cursor-paginated workspace role listing
+"""
+
+from apps.users.models import User
+from apps.workspaces.models import WorkspaceRole, WorkspaceRoleType
+from apps.workspaces.tests.base import WorkspaceTestCase, workspace_roles_url
+
+
+class WorkspaceRolesPaginationTests(WorkspaceTestCase):
+    """
+    Following the cursor links of the role listing visits every role exactly once.
+    """
+
+    def test_cursor_pages_cover_every_role(self):
+        members = User.objects.bulk_create(
+            [User(email=f"user{index}@example.com") for index in range(24)]
+        )
+        WorkspaceRole.objects.bulk_create(
+            [
+                WorkspaceRole(user=user, workspace=self.workspace, type=WorkspaceRoleType.MEMBER)
+                for user in members
+            ]
+        )
+        expected = {
+            str(role_id)
+            for role_id in WorkspaceRole.objects.filter(workspace=self.workspace).values_list(
+                "id", flat=True
+            )
+        }
+
+        seen = []
+        pages = 0
+        url = f"{workspace_roles_url(self.workspace)}?size=10"
+        while url:
+            body = self.get_as(self.owner, url).json()
+            self.assertLessEqual(len(body["results"]), 10)
+            seen.extend(role["id"] for role in body["results"])
+            pages += 1
+            url = body["next"]
+
+        self.assertEqual(pages, 3)
+        self.assertEqual(len(seen), len(expected))
+        self.assertEqual(set(seen), expected)
@@ -0,0 +1,59 @@
+"""
+Tests for workspace role permissions and their role lookup cache
+"""
+
+from django.core.cache import cache
+
+from apps.workspaces.cache import role_cache_key
+from apps.workspaces.models import Workspace, WorkspaceRole, WorkspaceRoleType
+from apps.workspaces.tests.base import SharedCacheMixin, WorkspaceTestCase, workspace_roles_url
+
+
+class WorkspacePermissionTests(WorkspaceTestCase):
+    """
+    Workspace permissions follow role changes immediately.
+    """
+
+    def test_revoked_member_is_forbidden(self):
+        role = Workspace.objects.add_user(self.workspace, self.member, WorkspaceRoleType.MEMBER)
+        url = workspace_roles_url(self.workspace)
+        self.assertEqual(self.get_as(self.member, url).status_code, 200)
+
+        WorkspaceRole.objects.delete(role)
+
+        self.assertEqual(self.get_as(self.member, url).status_code, 403)
+
+    def test_non_member_is_forbidden(self):
+        url = workspace_roles_url(self.workspace)
+        self.assertEqual(self.get_as(self.member, url).status_code, 403)
+
+    def test_anonymous_user_is_unauthorized(self):
+        response = self.client.get(workspace_roles_url(self.workspace))
+        self.assertEqual(response.status_code, 401)
+
+
+class ProcessLocalCacheTests(WorkspaceTestCase):
+    """
+    A per-process cache (the default LocMemCache) never holds roles across requests.
+    """
+
+    def test_found_role_is_not_cached(self):
+        self.get_as(self.owner, workspace_roles_url(self.workspace))
+
+        self.assertIsNone(cache.get(role_cache_key(self.owner.id, self.workspace.id)))
+
+
+class SharedCachePermissionTests(SharedCacheMixin, WorkspacePermissionTests):
+    """
+    With a shared cache, found roles are cached and dropped whenever they change.
+    """
+
+    def test_role_is_cached_and_invalidated_on_update(self):
+        role = Workspace.objects.add_user(self.workspace, self.member, WorkspaceRoleType.MEMBER)
+        key = role_cache_key(self.member.id, self.workspace.id)
+        self.get_as(self.member, workspace_roles_url(self.workspace))
+        self.assertEqual(cache.get(key), WorkspaceRoleType.MEMBER)
+
+        WorkspaceRole.objects.update_role(role, WorkspaceRoleType.OWNER)
+
+        self.assertIsNone(cache.get(key))
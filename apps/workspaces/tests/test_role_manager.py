@@ -0,0 +1,86 @@
+"""
+Tests for the workspace role manager
+"""
+
+from django.db import IntegrityError, connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from apps.workspaces.models import Workspace, WorkspaceRole, WorkspaceRoleType
+from apps.workspaces.tests.base import WorkspaceTestCase
+
+
+class WorkspaceRoleCreateTests(WorkspaceTestCase):
+    """
+    Duplicate roles are reported as ValueError; other integrity errors are not.
+    """
+
+    def test_duplicate_role_raises_value_error(self):
+        with transaction.atomic():
+            with self.assertRaisesMessage(ValueError, "User already has a role in the workspace"):
+                WorkspaceRole.objects.create(self.owner, self.workspace, WorkspaceRoleType.MEMBER)
+
+            # The failed INSERT did not break the enclosing transaction
+            self.assertEqual(WorkspaceRole.objects.filter(workspace=self.workspace).count(), 1)
+
+    def test_other_integrity_errors_propagate(self):
+        with self.assertRaises(IntegrityError):
+            WorkspaceRole.objects.create(self.member, self.workspace, None)
+
+        self.assertFalse(WorkspaceRole.objects.filter(user=self.member).exists())
+
+
+class WorkspaceRoleUpdateTests(WorkspaceTestCase):
+    """
+    update_role writes only the role type and update time, and reports missing roles.
+    """
+
+    def test_updates_only_type_and_updated_at(self):
+        role = WorkspaceRole.objects.create(self.member, self.workspace, WorkspaceRoleType.MEMBER)
+
+        with CaptureQueriesContext(connection) as queries:
+            WorkspaceRole.objects.update_role(role, WorkspaceRoleType.OWNER)
+
+        (update,) = [query["sql"] for query in queries if query["sql"].startswith("UPDATE")]
+        self.assertIn('"type"', update)
+        self.assertIn('"updated_at"', update)
+        self.assertNotIn('"created_at"', update)
+        role.refresh_from_db()
+        self.assertEqual(role.type, WorkspaceRoleType.OWNER)
+
+    def test_missing_role_raises_value_error(self):
+        role = WorkspaceRole.objects.create(self.member, self.workspace, WorkspaceRoleType.MEMBER)
+        WorkspaceRole.objects.filter(pk=role.pk).delete()
+
+        with self.assertRaisesMessage(ValueError, "Workspace role not found"):
+            WorkspaceRole.objects.update_role(role, WorkspaceRoleType.OWNER)
+
+
+class WorkspaceRoleQueryTests(WorkspaceTestCase):
+    """
+    Role queries order their results explicitly, as the model has no default ordering.
+    """
+
+    def test_get_by_user_orders_by_type_then_update_time(self):
+        Workspace.objects.create(name="Side project", created_by=self.member)
+        Workspace.objects.add_user(self.workspace, self.member, WorkspaceRoleType.MEMBER)
+
+        roles = WorkspaceRole.objects.get_by_user(self.member)
+
+        self.assertTrue(roles.ordered)
+        self.assertEqual(
+            [role.type for role in roles], [WorkspaceRoleType.MEMBER, WorkspaceRoleType.OWNER]
+        )
+
+    def test_get_by_workspace_orders_by_type_then_update_time(self):
+        Workspace.objects.add_user(self.workspace, self.member, WorkspaceRoleType.MEMBER)
+
+        roles = WorkspaceRole.objects.get_by_workspace(self.workspace)
+
+        self.assertTrue(roles.ordered)
+        self.assertEqual([role.user for role in roles], [self.member, self.owner])
+
+    def test_get_by_user_and_workspace(self):
+        self.assertEqual(
+            WorkspaceRole.objects.get_by_user_and_workspace(self.owner, self.workspace),
+            self.owner_role,
+        )
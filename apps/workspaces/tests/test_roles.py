@@ -0,0 +1,64 @@
+"""
+Tests for the cached workspace role listing
+"""
+
+from django.core.cache import cache
+
+from apps.workspaces.cache import user_roles_cache_key
+from apps.workspaces.models import Workspace, WorkspaceRole, WorkspaceRoleType
+from apps.workspaces.tests.base import MY_ROLES_URL, SharedCacheMixin, WorkspaceTestCase
+
+
+class UserRolesCacheTests(SharedCacheMixin, WorkspaceTestCase):
+    """
+    With a shared cache, the role listing is cached and dropped whenever one of the
+    user's roles changes.
+    """
+
+    def test_role_create_invalidates_listing(self):
+        self.assertEqual(self.get_as(self.member, MY_ROLES_URL).json(), [])
+        self.assertIsNotNone(cache.get(user_roles_cache_key(self.member.id)))
+
+        Workspace.objects.add_user(self.workspace, self.member, WorkspaceRoleType.MEMBER)
+
+        roles = self.get_as(self.member, MY_ROLES_URL).json()
+        self.assertEqual([role["type"] for role in roles], [WorkspaceRoleType.MEMBER])
+
+    def test_role_update_invalidates_listing(self):
+        role = Workspace.objects.add_user(self.workspace, self.member, WorkspaceRoleType.MEMBER)
+        self.get_as(self.member, MY_ROLES_URL)
+
+        WorkspaceRole.objects.update_role(role, WorkspaceRoleType.OWNER)
+
+        roles = self.get_as(self.member, MY_ROLES_URL).json()
+        self.assertEqual([role["type"] for role in roles], [WorkspaceRoleType.OWNER])
+
+    def test_role_delete_invalidates_listing(self):
+        role = Workspace.objects.add_user(self.workspace, self.member, WorkspaceRoleType.MEMBER)
+        self.assertEqual(len(self.get_as(self.member, MY_ROLES_URL).json()), 1)
+
+        WorkspaceRole.objects.delete(role)
+
+        self.assertEqual(self.get_as(self.member, MY_ROLES_URL).json(), [])
+
+    def test_bulk_create_with_owner_invalidates_listing(self):
+        self.assertEqual(self.get_as(self.member, MY_ROLES_URL).json(), [])
+
+        Workspace.objects.bulk_create_with_owner([("Side project", self.member, "")])
+
+        roles = self.get_as(self.member, MY_ROLES_URL).json()
+        self.assertEqual([role["type"] for role in roles], [WorkspaceRoleType.OWNER])
+
+
+class ProcessLocalUserRolesTests(WorkspaceTestCase):
+    """
+    A per-process cache (the default LocMemCache) never holds role listings.
+    """
+
+    def test_listing_is_not_cached(self):
+        self.assertEqual(self.get_as(self.member, MY_ROLES_URL).json(), [])
+        self.assertIsNone(cache.get(user_roles_cache_key(self.member.id)))
+
+        Workspace.objects.add_user(self.workspace, self.member, WorkspaceRoleType.MEMBER)
+
+        self.assertEqual(len(self.get_as(self.member, MY_ROLES_URL).json()), 1)
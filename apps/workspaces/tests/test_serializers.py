@@ -0,0 +1,52 @@
+"""
+Tests for the workspace role serializers
+"""
+
+import json
+
+from rest_framework.renderers import JSONRenderer
+
+from apps.users.models import User
+from apps.workspaces.api.v1.serializers import WorkspaceRoleSerializer
+from apps.workspaces.models import Workspace, WorkspaceRole, WorkspaceRoleType
+from apps.workspaces.tests.base import WorkspaceTestCase
+
+
+def rendered(data):
+    """Return data as the API client receives it, after DRF's JSON rendering."""
+    return json.loads(JSONRenderer().render(data))
+
+
+class WorkspaceRoleBulkRepresentationTests(WorkspaceTestCase):
+    """
+    The hand-built role rows match WorkspaceRoleSerializer field for field.
+    """
+
+    def setUp(self):
+        super().setUp()
+        other, _ = Workspace.objects.create(
+            name="Side project", created_by=self.member, description="Notes"
+        )
+        Workspace.objects.add_user(self.workspace, self.member, WorkspaceRoleType.MEMBER)
+        Workspace.objects.add_user(other, self.owner, WorkspaceRoleType.MEMBER)
+        guest = User.objects.create(identifier="guest@example.com")
+        Workspace.objects.add_user(other, guest, WorkspaceRoleType.MEMBER)
+        self.roles = WorkspaceRole.objects.order_by("type", "updated_at")
+
+    def test_matches_serializer(self):
+        rows = WorkspaceRoleSerializer.bulk_representation(
+            WorkspaceRoleSerializer.bulk_values(self.roles)
+        )
+
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows, WorkspaceRoleSerializer(self.roles, many=True).data)
+
+    def test_matches_serializer_with_workspace_details(self):
+        rows = WorkspaceRoleSerializer.bulk_representation(
+            WorkspaceRoleSerializer.bulk_values(self.roles, include_workspace=True),
+            include_workspace=True,
+        )
+        data = WorkspaceRoleSerializer(self.roles, many=True, include_workspace=True).data
+
+        # The serializer leaves nested datetimes to the renderer, so compare the JSON
+        self.assertEqual(rendered(rows), rendered(data))
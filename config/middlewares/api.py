@@ -3,73 +3,219 @@ Combined API Middleware for versioning and exception handling.
 """
 
 import logging
-from django.http import JsonResponse
+from http import HTTPStatus
+from functools import lru_cache, singledispatch
+import orjson
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.http import HttpResponse
 from django.conf import settings
-from django.utils.deprecation import MiddlewareMixin
+from rest_framework.exceptions import APIException
+
+from apps.core.utils.json import orjson_default
 
 logger = logging.getLogger(__name__)
 
+try:
+    from config.urls import API_VERSIONS
+
+    _SUPPORTED_VERSIONS = frozenset(API_VERSIONS)
+except ImportError:
+    # If import fails, skip validation
+    _SUPPORTED_VERSIONS = None
+
+# Versioned API routes live under this prefix, e.g. /api/v1/...
+_API_PREFIX = "/api/"
+_API_PREFIX_LEN = len(_API_PREFIX)
 
-def error_response(status_code: int, message: str, details=None) -> JsonResponse:
+# Detail containers whose first item is used as the message
+_SEQUENCE_TYPES = (list, tuple)
+
+
+@singledispatch
+def _extract_message(details):
     """
-    Standardized JSON response for API errors.
+    Extract a short string message.
+
+    Dispatches on the type of ``details``; subclasses such as DRF's ReturnDict, ReturnList
+    and ErrorDetail resolve through singledispatch's per-type cache.
     """
+    return None
+
+
+@_extract_message.register
+def _(details: dict):
+    if not details:
+        return None
+    # Use the first value in dict
+    val = next(iter(details.values()))
+    if isinstance(val, _SEQUENCE_TYPES) and val:
+        return str(val[0])
+    return str(val)
+
+
+@_extract_message.register(list)
+@_extract_message.register(tuple)
+def _(details):
+    return str(details[0]) if details else None
+
+
+@_extract_message.register
+def _(details: str):
+    return details
+
+
+# Error details may hold int keys (ListField errors)
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+@lru_cache(maxsize=256)
+def _error_body(status_code: int, message: str) -> bytes:
+    """Render the body of an error response without details."""
+    return b'{"code":%d,"message":%s}' % (
+        status_code,
+        orjson.dumps(message, default=orjson_default),
+    )
+
+
+@lru_cache(maxsize=256)
+def _detail_error_body(status_code: int, message: str, detail: str) -> bytes:
+    """Render the body of an error whose details are DRF's plain ``{"detail": str}``."""
+    return b'{"code":%d,"message":%s,"details":{"detail":%s}}' % (
+        status_code,
+        orjson.dumps(message, default=orjson_default),
+        orjson.dumps(detail, default=orjson_default),
+    )
+
+
+def _prerender_common_errors() -> None:
+    """Render the most common bodies at import, so even the first such error does no dumps."""
+    for status_code in (400, 401, 403, 404, 405, 500):
+        _error_body(status_code, HTTPStatus(status_code).phrase)
+    _error_body(400, "Unsupported API version")
+
+
+_prerender_common_errors()
+
+
+def _error_content(status_code: int, message: str, details=None) -> bytes:
+    """Render the JSON body of an API error."""
+    if not details:
+        # Status/message pairs repeat (auth failures, bad versions), so reuse rendered bodies
+        return _error_body(status_code, message)
+
+    # DRF's exception handler answers most errors (401, 403, 404, throttling) with a lone
+    # {"detail": "..."}; render those from strings without building the payload dict
+    if isinstance(details, dict) and len(details) == 1:
+        detail = details.get("detail")
+        if isinstance(detail, str):
+            return _detail_error_body(status_code, message, detail)
+
     payload = {
         "code": status_code,
         "message": message,
+        "details": details,
     }
-    if details:
-        payload["details"] = details
-    return JsonResponse(payload, status=status_code)
+    return orjson.dumps(payload, default=orjson_default, option=_ORJSON_OPTIONS)
+
+
+class APIErrorResponse(HttpResponse):
+    """
+    Error response already in the API envelope; APIMiddleware passes it through as is.
+    """
 
 
-class APIMiddleware(MiddlewareMixin):
+def error_response(status_code: int, message: str, details=None) -> APIErrorResponse:
+    """
+    Standardized JSON response for API errors.
+    """
+    return APIErrorResponse(
+        _error_content(status_code, message, details),
+        status=status_code,
+        content_type="application/json",
+    )
+
+
+class APIMiddleware:
     """
     Combined middleware to handle API versioning and exception handling.
+
+    Runs natively in both modes: under ASGI the request is handled on the event loop,
+    without MiddlewareMixin's sync_to_async hop around the request/response hooks.
     """
 
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            # Mark the instance so Django awaits it
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        response = self.process_request(request)
+        if response is None:
+            response = self.get_response(request)
+        return self.process_response(request, response)
+
+    async def __acall__(self, request):
+        """Async counterpart of __call__; the hooks do no I/O, so they run inline."""
+        response = self.process_request(request)
+        if response is None:
+            response = await self.get_response(request)
+        return self.process_response(request, response)
+
     def process_request(self, request):
         """Process API versioning for incoming requests."""
         path = request.path_info
+        if _SUPPORTED_VERSIONS is None or not path.startswith(_API_PREFIX):
+            return None
 
-        # Extract version from path
-        path_parts = path.split("/")
-        if len(path_parts) >= 3 and path_parts[1] == "api":
-            version = path_parts[2]
-
-            try:
-                from config.urls import API_VERSIONS as urls_api_versions  # pylint: disable=import-outside-toplevel
-
-                if version not in urls_api_versions:
-                    return error_response(400, "Unsupported API version")
-            except ImportError:
-                # If import fails, skip validation
-                pass
+        # Extract version from path: the segment after the prefix, without splitting the rest
+        version = path[_API_PREFIX_LEN:].partition("/")[0]
+        if version not in _SUPPORTED_VERSIONS:
+            return error_response(400, "Unsupported API version")
 
         return None
 
     def process_response(self, _, response):
         """Process API responses for error handling."""
-        status_code = getattr(response, "status_code", 500)
+        status_code = response.status_code
+        # Successes, and errors this middleware already built (keeping their message)
+        if status_code < 400 or isinstance(response, APIErrorResponse):
+            return response
+
         # Extract message from response if available
         details = getattr(response, "data", None)
         message = self._extract_message(details) or response.reason_phrase or "Error"
-        if status_code >= 400:
+        if not hasattr(response, "accepted_renderer"):
             return error_response(status_code, message, details)
 
+        # DRF response: swap the envelope into the response DRF already built and rendered,
+        # keeping its headers, instead of allocating a new one
+        response.content = _error_content(status_code, message, details)
+        response["Content-Type"] = "application/json"
+        response["Content-Length"] = str(len(response.content))
         return response
 
     def process_exception(self, _, exception):
         """Handle exceptions for API requests."""
         return self._handle_api_exception(exception)
 
-    def _handle_api_exception(self, exc) -> JsonResponse:
+    def _handle_api_exception(self, exc) -> APIErrorResponse:
         """
         Handle exceptions and return structured JSON with code, message, and details.
         """
-        logger.exception("Unhandled exception: %s", exc)
-
         status_code = getattr(exc, "status_code", 500)
+        if isinstance(exc, APIException) and status_code < 500:
+            # Expected client error: no traceback to capture
+            logger.info("Client error %s: %s", status_code, exc)
+        else:
+            logger.exception("Unhandled exception: %s", exc)
+
         details = getattr(exc, "detail", str(exc))  # DRF exceptions usually have .detail
         message = self._extract_message(details) or type(exc).__name__
 
@@ -80,19 +226,4 @@ class APIMiddleware(MiddlewareMixin):
 
         return error_response(status_code, message, details)
 
-    @staticmethod
-    def _extract_message(details):
-        """
-        Extract a short string message.
-        """
-        if isinstance(details, (list, tuple)) and details:
-            return str(details[0])
-        if isinstance(details, dict):
-            # Return first value in dict
-            for val in details.values():
-                if isinstance(val, (list, tuple)) and val:
-                    return str(val[0])
-                return str(val)
-        if isinstance(details, str):
-            return details
-        return None
+    _extract_message = staticmethod(_extract_message)
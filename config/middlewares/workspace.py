@@ -3,10 +3,15 @@ Workspace Middleware
 
 """
 
+import re
 import uuid
 from django.utils.deprecation import MiddlewareMixin
 from rest_framework.exceptions import ValidationError
 
+_UUID_PATTERN = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE
+)
+
 
 class WorkspaceMiddleware(MiddlewareMixin):
     """
@@ -32,8 +37,7 @@ class WorkspaceMiddleware(MiddlewareMixin):
         """
         Validate if the value is a valid UUID.
         """
-        try:
-            uuid.UUID(str(value))
+        # The <uuid:...> path converter already hands over parsed UUIDs
+        if isinstance(value, uuid.UUID):
             return True
-        except (ValueError, TypeError):
-            return False
+        return isinstance(value, str) and _UUID_PATTERN.fullmatch(value) is not None
@@ -1,9 +1,12 @@
 """
 Custom pagination class for the API.
 """
-from rest_framework.pagination import PageNumberPagination
+from django.http import JsonResponse
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 from rest_framework.response import Response
 
+from apps.core.utils.json import COMPACT_JSON_DUMPS_PARAMS
+
 
 class CustomPageNumberPagination(PageNumberPagination):
     """
@@ -22,3 +25,26 @@ class CustomPageNumberPagination(PageNumberPagination):
             'page': self.page.number,
             'results': data
         })
+
+
+class WorkspaceCursorPagination(CursorPagination):
+    """
+    Keyset pagination for workspace listings that can grow large:
+    - no COUNT(*) per request
+    - each page costs the same regardless of depth
+    - returns next/previous cursor links and results
+
+    Pages are expected to hold plain JSON data and are rendered with JsonResponse,
+    skipping DRF's renderer negotiation.
+    """
+    page_size = 20
+    page_size_query_param = 'size'
+    max_page_size = 100
+    ordering = ('-updated_at', 'id')
+
+    def get_paginated_response(self, data):
+        return JsonResponse({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data
+        }, json_dumps_params=COMPACT_JSON_DUMPS_PARAMS)
@@ -162,6 +162,8 @@ CORS_ALLOWED_ORIGINS = [
 CORS_ALLOW_CREDENTIALS = True
 
 # Cache configuration for OTP storage
+# Process-local; workspace role lookups are only cached across requests with a
+# backend shared by all workers (see apps.workspaces.cache)
 CACHES = {
     "default": {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
@@ -176,6 +178,7 @@ CACHES = {
 # OTP Configuration
 OTP_LENGTH = 6
 OTP_EXPIRY_MINUTES = 15
+OTP_MAX_PENDING = config("OTP_MAX_PENDING", default=1000, cast=int)
 
 # Email Configuration
 EMAIL_BACKEND = config("EMAIL_BACKEND", default="django.core.mail.backends.smtp.EmailBackend")
@@ -187,6 +190,7 @@ EMAIL_HOST_USER = config("EMAIL_HOST_USER")
 EMAIL_HOST_PASSWORD = config("EMAIL_HOST_PASSWORD")
 DEFAULT_FROM_EMAIL = config("DEFAULT_FROM_EMAIL")
 EMAIL_TIMEOUT = config("EMAIL_TIMEOUT", default=30, cast=int)
+EMAIL_WORKERS = config("EMAIL_WORKERS", default=4, cast=int)
 
 # Email Service Configuration
 APP_NAME = config("APP_NAME", default="billnet")
@@ -0,0 +1,62 @@
+"""
+Tests for the API versioning and error envelope middleware
+"""
+
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase
+from rest_framework.test import APIClient
+
+from config.middlewares.api import APIMiddleware
+
+
+class APIMiddlewareAsyncTests(SimpleTestCase):
+    """
+    Under ASGI the middleware runs as a coroutine and still wraps errors.
+    """
+
+    def test_async_mode_wraps_errors(self):
+        async def get_response(request):
+            return HttpResponse(status=404)
+
+        middleware = APIMiddleware(get_response)
+        response = async_to_sync(middleware)(RequestFactory().get("/api/v1/anything/"))
+
+        self.assertTrue(iscoroutinefunction(middleware))
+        self.assertEqual(response.content, b'{"code":404,"message":"Not Found"}')
+
+
+class APIMiddlewareRewriteTests(SimpleTestCase):
+    """
+    DRF error responses are rewritten into the envelope in place.
+    """
+
+    def test_drf_error_is_rewritten_in_place(self):
+        response = APIClient().get("/api/v1/workspaces/my-roles/")
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(response["Content-Length"], str(len(response.content)))
+        # DRF's own headers survive the rewrite
+        self.assertIn("WWW-Authenticate", response)
+        body = response.json()
+        self.assertEqual(body["code"], 401)
+        self.assertEqual(body["message"], body["details"]["detail"])
+
+
+class APIMiddlewareResponseTests(SimpleTestCase):
+    """
+    The middleware's own error responses and successful responses pass through untouched.
+    """
+
+    def test_unsupported_version_keeps_its_message(self):
+        response = APIClient().get("/api/v9/workspaces/my-roles/")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"code": 400, "message": "Unsupported API version"})
+
+    def test_success_passes_through(self):
+        original = HttpResponse(b"ok")
+        middleware = APIMiddleware(lambda request: original)
+
+        self.assertIs(middleware(RequestFactory().get("/api/v1/anything/")), original)
@@ -0,0 +1,51 @@
+"""
+Tests for the workspace id middleware
+"""
+
+import uuid
+from types import SimpleNamespace
+
+from django.test import RequestFactory, SimpleTestCase
+from rest_framework.exceptions import ValidationError
+
+from config.middlewares.workspace import WorkspaceMiddleware
+
+WORKSPACE_ID = "3f2b8c1e-9a4d-4e6f-8b7a-1c2d3e4f5a6b"
+
+
+class WorkspaceMiddlewareTests(SimpleTestCase):
+    """
+    Only canonical dashed UUIDs (or parsed UUIDs) are accepted as workspace ids.
+    """
+
+    def setUp(self):
+        self.middleware = WorkspaceMiddleware(lambda request: None)
+
+    def process(self, **kwargs):
+        """Run the middleware on a request resolved with the given URL kwargs."""
+        request = RequestFactory().get("/")
+        request.resolver_match = SimpleNamespace(kwargs=kwargs)
+        self.middleware.process_request(request)
+        return request
+
+    def test_accepts_canonical_and_parsed_uuids(self):
+        for value in (WORKSPACE_ID, WORKSPACE_ID.upper(), uuid.UUID(WORKSPACE_ID)):
+            with self.subTest(value=value):
+                self.assertEqual(self.process(workspace_id=value).workspace_id, value)
+
+    def test_rejects_other_spellings(self):
+        for value in (
+            WORKSPACE_ID.replace("-", ""),
+            f"{{{WORKSPACE_ID}}}",
+            f"urn:uuid:{WORKSPACE_ID}",
+            f"{WORKSPACE_ID}\n",
+            WORKSPACE_ID[:-1],
+            WORKSPACE_ID[:-1] + "g",
+            "",
+            42,
+        ):
+            with self.subTest(value=value), self.assertRaises(ValidationError):
+                self.process(workspace_id=value)
+
+    def test_requests_without_workspace_get_none(self):
+        self.assertIsNone(self.process().workspace_id)
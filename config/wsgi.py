@@ -1,5 +1,8 @@
 """
 WSGI config for project.
+
+Agent responses are only streamed under ASGI (config/asgi.py, served by run.py);
+behind this WSGI entry point their server-sent events are buffered until complete.
 """
 
 import os
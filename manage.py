@@ -2,33 +2,48 @@
 """Django's command-line utility for administrative tasks."""
 import os
 import sys
+from functools import cache
 import django
+from django.core.management import call_command
 
 
+@cache
+def _ensure_setup():
+    """Configure settings and build the app registry, once per process."""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    django.setup()
+
+
+@cache
 def get_apps_in_directory():
-    """Get all apps in the apps/ directory that have apps.py."""
-    apps_dir = os.path.join(os.path.dirname(__file__), "apps")
-    app_names = []
+    """
+    Get all apps in the apps/ directory that have apps.py.
 
-    if os.path.exists(apps_dir):
-        for item in os.listdir(apps_dir):
-            item_path = os.path.join(apps_dir, item)
-            if os.path.isdir(item_path):
-                apps_py_path = os.path.join(item_path, "apps.py")
-                if os.path.exists(apps_py_path):
-                    if item == "auth" :
-                        continue
-                    app_names.append(item)
+    The directory is scanned once per process; scandir reports entry types
+    without a stat call per item.
+    """
+    apps_dir = os.path.join(os.path.dirname(__file__), "apps")
+    if not os.path.isdir(apps_dir):
+        return ()
 
-    return app_names
+    with os.scandir(apps_dir) as entries:
+        return tuple(
+            entry.name
+            for entry in entries
+            if entry.name != "auth"
+            and entry.is_dir()
+            and os.path.isfile(os.path.join(entry.path, "apps.py"))
+        )
 
 
 def makemigrations():
-    """Run makemigrations for all apps in apps/ directory."""
-    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
-    django.setup()
+    """
+    Run makemigrations for all apps in apps/ directory.
 
-    from django.core.management import call_command  # pylint: disable=import-outside-toplevel
+    All apps go through one autodetector run, so migrations that depend on each
+    other across apps are numbered and linked consistently.
+    """
+    _ensure_setup()
 
     app_names = get_apps_in_directory()
     if not app_names:
@@ -37,23 +52,22 @@ def makemigrations():
 
     print(f"🔄 Running makemigrations for {len(app_names)} apps: {', '.join(app_names)}")
 
-    for app_name in app_names:
-        try:
-            print(f"\n🔄 Running makemigrations for {app_name}...")
-            call_command("makemigrations", app_name, verbosity=1)
-            print(f"✅ Completed makemigrations for {app_name}")
-        except Exception as e:
-            print(f"❌ Error running makemigrations for {app_name}: {str(e)}")
+    try:
+        call_command("makemigrations", *app_names, verbosity=1)
+    except Exception as e:
+        print(f"❌ Error running makemigrations: {str(e)}")
+        return
 
     print(f"\n✅ Completed makemigrations for all {len(app_names)} apps")
 
 
 def migrate():
-    """Run migrate for all apps in apps/ directory."""
-    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
-    django.setup()
+    """
+    Run migrate for all apps in apps/ directory.
 
-    from django.core.management import call_command  # pylint: disable=import-outside-toplevel
+    Apps are migrated one at a time; migrations depend on other apps' migrations.
+    """
+    _ensure_setup()
 
     app_names = get_apps_in_directory()
     if not app_names:
@@ -8,10 +8,24 @@ def main():
     """Main function to start the server."""
     host = config("HOST", default="127.0.0.1")
     port = config("PORT", default=8000, cast=int)
-    reload = config("DEBUG", default=False, cast=bool)
+    workers = config("WORKERS", default=1, cast=int)
+    # Reloading only works with a single process
+    reload = config("DEBUG", default=False, cast=bool) and workers == 1
     log_level = config("LOG_LEVEL", default="info", cast=str).lower()
+    # Installed by uvicorn[standard]; set to "auto" on platforms without them (e.g. Windows)
+    loop = config("UVICORN_LOOP", default="uvloop")
+    http = config("UVICORN_HTTP", default="httptools")
 
-    uvicorn.run("config.asgi:application", host=host, port=port, reload=reload, log_level=log_level)
+    uvicorn.run(
+        "config.asgi:application",
+        host=host,
+        port=port,
+        reload=reload,
+        log_level=log_level,
+        loop=loop,
+        http=http,
+        workers=workers,
+    )
 
 
 if __name__ == "__main__":
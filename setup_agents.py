@@ -3,11 +3,13 @@
 Setup script for agents app
 """
 
+import argparse
 import os
+import subprocess
 import sys
 from pathlib import Path
 
-def setup_agents():
+def setup_agents(verify=True):
     """Setup the agents app with required dependencies and configuration"""
     
     print("Setting up Billnet Agents App...")
@@ -19,7 +21,7 @@ def setup_agents():
     
     # Install dependencies
     print("\n1. Installing dependencies...")
-    os.system("poetry install")
+    subprocess.run(["poetry", "install"], check=False)
     
     # Check for required environment variables
     print("\n2. Checking environment configuration...")
@@ -65,10 +67,29 @@ APP_NAME=billnet
         print("Please add your Gemini API key to the .env file")
     
     # Run migrations
+    # In-process, so Django is bootstrapped once for both commands (and the checks below)
     print("\n3. Running database migrations...")
-    os.system("python manage.py makemigrations")
-    os.system("python manage.py migrate")
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    try:
+        import django  # pylint: disable=import-outside-toplevel
+        from django.core.management import call_command  # pylint: disable=import-outside-toplevel
+
+        django.setup()
+        call_command("makemigrations")
+        call_command("migrate")
+    except ImportError as e:
+        print(f"Error: Could not import Django: {e}")
+        print("Please run this script inside the project environment:")
+        print("  poetry run python setup_agents.py")
+    except Exception as e:  # pylint: disable=broad-except
+        # CommandError, database and configuration errors: report them and carry on
+        print(f"Error: Database migrations failed: {e}")
+        print("Please check the database settings in your .env file and rerun the migrations")
     
+    if not verify:
+        print("\n✓ Agents app setup completed (verification skipped)")
+        return
+
     # Test the setup
     print("\n4. Testing the setup...")
     try:
@@ -93,4 +114,11 @@ APP_NAME=billnet
         sys.exit(1)
 
 if __name__ == "__main__":
-    setup_agents()
+    parser = argparse.ArgumentParser(description="Set up the Billnet agents app")
+    parser.add_argument(
+        "--skip-verify",
+        action="store_true",
+        help="Skip importing the agents modules after setup",
+    )
+    args = parser.parse_args()
+    setup_agents(verify=not args.skip_verify)